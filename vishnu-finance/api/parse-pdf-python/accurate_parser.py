@@ -11,14 +11,119 @@ Supports PDF statements from multiple Indian banks including:
 - Indian Bank (IDIB)
 """
 
+import logging
 import re
 import sqlite3
+from functools import lru_cache
 import pandas as pd
 from pathlib import Path
 import pdfplumber
 
+# PyMuPDF extracts page text far faster than pdfplumber (pdfminer);
+# fall back to pdfplumber when it is not installed.
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+try:
+    from parsers.base_parser import pymupdf_page_text
+except ImportError:
+    from base_parser import pymupdf_page_text
+
+logger = logging.getLogger(__name__)
+
+# Patterns used per transaction, compiled once at import time
+_COMMODITY_PATTERNS = (
+    # Pattern 1: XXXXX /something /UPI /numbers /commodity
+    r'/\s*XXXXX\s*/\s*[^/]+\s*/\s*UPI\s*/\s*[0-9]+\s*/\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)*)',
+    # Pattern 2: XXXXX /something /commodity /BRANCH
+    r'/\s*XXXXX\s*/\s*[^/]+\s*/\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)*)(?:\s*/\s*(?:BRANCH|@))',
+    # Pattern 3: Direct commodity before UPI/BRANCH
+    r'/\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)*)(?:\s*/\s*(?:UPI|BRANCH|paytmqr|@))',
+    # Pattern 4: Commodity at the end
+    r'/\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)*)(?:\s*$)',
+)
+_COMMODITY_RES = [re.compile(pattern) for pattern in _COMMODITY_PATTERNS]
+# All four in one pass, in priority order: each alternative scans the whole text
+# before the next is tried, and group i is pattern i's capture
+_COMMODITY_RE = re.compile('^(?:' + '|'.join('.*?' + pattern for pattern in _COMMODITY_PATTERNS) + ')',
+                           re.DOTALL)
+# Technical codes and meaningless words that are never a commodity
+_NON_COMMODITIES = frozenset({'XXXXX', 'UPI', 'BRANCH', 'ATM', 'SERVICE'})
+_CODE_RE = re.compile(r'/\s*[A-Z0-9@]+')
+_UPI_RE = re.compile(r'/\s*UPI')
+_BRANCH_RE = re.compile(r'/\s*BRANCH.*')
+_PAYTM_RE = re.compile(r'/\s*paytmqr.*')
+_XXXXX_RE = re.compile(r'/\s*XXXXX')
+
+_DATE_RE = re.compile(r'(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})')
+# Same date, matched within a single line of page text
+_LINE_DATE = r'\d{1,2}[^\S\n]+[A-Za-z]{3}[^\S\n]+\d{4}'
+# A line containing a date, then every following line that is neither blank nor dated
+_TRANSACTION_RE = re.compile(
+    r'^[^\n]*?(?P<date>' + _LINE_DATE + r')[^\n]*'
+    r'(?:\n(?![^\S\n]*$)(?![^\n]*?' + _LINE_DATE + r')[^\n]*)*',
+    re.MULTILINE,
+)
+# Debit ("INR x - INR bal") anywhere in the text wins over credit ("- INR x INR bal"),
+# so each alternative scans the whole text before the next one is tried
+_AMOUNT_RE = re.compile(
+    r'^(?:.*?INR\s*(?P<debit>[0-9,]+(?:\.[0-9]{2})?)\s*-\s*INR\s*(?P<debit_balance>[0-9,]+(?:\.[0-9]{2})?)'
+    r'|.*?-\s*INR\s*(?P<credit>[0-9,]+(?:\.[0-9]{2})?)\s*INR\s*(?P<credit_balance>[0-9,]+(?:\.[0-9]{2})?))',
+    re.DOTALL,
+)
+_INR_STRIP_RE = re.compile(r'INR\s*[0-9,]+(?:\.[0-9]{2})?')
+_STRIP_PM = str.maketrans('', '', '+-')
+_REMARK_RE = re.compile(r'/([A-Za-z][A-Za-z0-9 _.-]{2,})$')
+
+_TRANSACTION_COLUMNS = ('date', 'description', 'raw', 'remarks', 'amount', 'type', 'debit', 'credit',
+                        'balance', 'page', 'line', 'store', 'commodity')
+
+def _is_code(text):
+    """True if ``text`` is non-empty and only ASCII uppercase letters and digits ([A-Z0-9]+)."""
+    return text.isascii() and text.isalnum() and text == text.upper()
+
+def _is_commodity(candidate):
+    """True if a commodity pattern capture is a meaningful word rather than a technical code."""
+    return bool(candidate) and len(candidate) > 1 and candidate not in _NON_COMMODITIES
+
+def _remove_commodity(text, commodity):
+    """
+    Remove every "/commodity" from text.
+    
+    Matches a slash, optional whitespace, the commodity and then one whitespace
+    character or the end of the text, as the escaped-commodity regex did, but
+    with str.find/startswith so no pattern is built and compiled per commodity.
+    """
+    pieces = []
+    kept_from = 0
+    slash = text.find('/')
+    while slash != -1:
+        start = slash + 1
+        while start < len(text) and text[start].isspace():
+            start += 1
+        end = start + len(commodity)
+        if text.startswith(commodity, start) and (end == len(text) or text[end].isspace()):
+            pieces.append(text[kept_from:slash])
+            # The trailing whitespace character is removed along with the commodity
+            kept_from = min(end + 1, len(text))
+            slash = text.find('/', kept_from)
+        else:
+            slash = text.find('/', slash + 1)
+    if not pieces:
+        return text
+    pieces.append(text[kept_from:])
+    return ''.join(pieces)
+
+@lru_cache(maxsize=4096)
 def extract_store_and_commodity(description):
-    """Extract store name and commodity from transaction description."""
+    """
+    Extract store name and commodity from transaction description.
+    
+    Pure in its string argument, so results are memoized: statements repeat
+    the same merchants (rent, utilities, regular stores) many times.
+    """
     store = None
     commodity = None
     clean_description = description
@@ -26,355 +131,178 @@ def extract_store_and_commodity(description):
     # Pattern to match: TRANSACTION_CODE/Store Name /other_info /commodity
     # Example: YESB0PTMUPI/Sangam Stationery Stores /XXXXX /pens
     
-    # First, try to extract store name (text after first slash, before next slash or UPI/code)
-    store_match = re.search(r'^[A-Z0-9]+/([^/]+?)(?:\s*/\s*(?:[A-Z0-9@]+|UPI|BRANCH)|$)', description)
-    if store_match:
-        store = store_match.group(1).strip()
-        # Clean up store name
-        store = re.sub(r'\s+', ' ', store).strip()
+    # First, try to extract store name (text after first slash, before next slash or UPI/code).
+    # Equivalent to ^[A-Z0-9]+/([^/]+?)(?:\s*/\s*(?:[A-Z0-9@]+|UPI|BRANCH)|$), but split on
+    # the slashes with str.partition instead of running the regex engine
+    store_remainder = ''
+    code, sep, rest = description.partition('/')
+    if sep and _is_code(code):
+        name, sep, rest = rest.partition('/')
+        next_char = rest.lstrip()[:1]
+        if name and (not sep or next_char == '@' or _is_code(next_char)):
+            # Clean up store name
+            store = ' '.join(name.split())
+            store_remainder = sep + rest
     
     # Extract commodity - look for meaningful words, prioritize actual commodities over technical codes
-    commodity_patterns = [
-        # Pattern 1: XXXXX /something /UPI /numbers /commodity
-        r'/\s*XXXXX\s*/\s*[^/]+\s*/\s*UPI\s*/\s*[0-9]+\s*/\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)*)',
-        # Pattern 2: XXXXX /something /commodity /BRANCH
-        r'/\s*XXXXX\s*/\s*[^/]+\s*/\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)*)(?:\s*/\s*(?:BRANCH|@))',
-        # Pattern 3: Direct commodity before UPI/BRANCH
-        r'/\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)*)(?:\s*/\s*(?:UPI|BRANCH|paytmqr|@))',
-        # Pattern 4: Commodity at the end
-        r'/\s*([a-zA-Z]+(?:\s+[a-zA-Z]+)*)(?:\s*$)',
-    ]
-    
-    for pattern in commodity_patterns:
-        commodity_match = re.search(pattern, description)
-        if commodity_match:
-            candidate = commodity_match.group(1).strip()
-            # Skip technical codes and meaningless words
-            if candidate and len(candidate) > 1 and candidate not in ['XXXXX', 'UPI', 'BRANCH', 'ATM', 'SERVICE']:
-                commodity = candidate
+    commodity_match = _COMMODITY_RE.match(description)
+    if commodity_match:
+        pattern_index = commodity_match.lastindex
+        candidate = commodity_match.group(pattern_index).strip()
+        # A rejected candidate falls through to the later patterns, searched one by one
+        for pattern in _COMMODITY_RES[pattern_index:]:
+            if _is_commodity(candidate):
                 break
+            commodity_match = pattern.search(description)
+            candidate = commodity_match.group(1).strip() if commodity_match else None
+        if _is_commodity(candidate):
+            commodity = candidate
     
     # Clean up description
     clean_description = description
     
     # Remove store name part
     if store:
-        clean_description = re.sub(r'^[A-Z0-9]+/[^/]+', '', clean_description)
+        clean_description = store_remainder
     
     # Remove commodity
     if commodity:
-        clean_description = re.sub(r'/\s*' + re.escape(commodity) + r'(?:\s|$)', '', clean_description)
+        clean_description = _remove_commodity(clean_description, commodity)
     
     # Remove UPI IDs, codes, and other technical info
-    clean_description = re.sub(r'/\s*[A-Z0-9@]+', '', clean_description)  # Remove UPI IDs, codes
-    clean_description = re.sub(r'/\s*UPI', '', clean_description)  # Remove UPI references
-    clean_description = re.sub(r'/\s*BRANCH.*', '', clean_description)  # Remove branch info
-    clean_description = re.sub(r'/\s*paytmqr.*', '', clean_description)  # Remove Paytm QR codes
-    clean_description = re.sub(r'/\s*XXXXX', '', clean_description)  # Remove placeholder codes
-    clean_description = re.sub(r'\s+', ' ', clean_description).strip()  # Clean whitespace
+    clean_description = _CODE_RE.sub('', clean_description)  # Remove UPI IDs, codes
+    clean_description = _UPI_RE.sub('', clean_description)  # Remove UPI references
+    clean_description = _BRANCH_RE.sub('', clean_description)  # Remove branch info
+    clean_description = _PAYTM_RE.sub('', clean_description)  # Remove Paytm QR codes
+    clean_description = _XXXXX_RE.sub('', clean_description)  # Remove placeholder codes
+    clean_description = ' '.join(clean_description.split())  # Clean whitespace
     
     return store, commodity, clean_description
 
-def parse_bank_statement_accurately(pdf_path: Path) -> pd.DataFrame:
-    """Parse bank statement with accurate debit/credit detection."""
+def _finalize_transaction(current_date, current_transaction_lines, page_num, line_num, transactions):
+    """Parse a buffered multi-line transaction and append it to the ``transactions`` columns."""
+    full_description = ' '.join(current_transaction_lines)
+    # Both amount forms need "INR"; most buffered non-transaction text has none
+    if 'INR' not in full_description:
+        return
     
-    transactions = []
+    match = _AMOUNT_RE.match(full_description)
+    if match:
+        is_credit = match.group('debit') is None
+        if is_credit:
+            transaction_amount = float(match.group('credit').replace(',', ''))
+            balance = float(match.group('credit_balance').replace(',', ''))
+        else:
+            transaction_amount = float(match.group('debit').replace(',', ''))
+            balance = float(match.group('debit_balance').replace(',', ''))
+        
+        # Store raw description before processing
+        raw_description = full_description
+        
+        # Extract description
+        description = full_description
+        description = _DATE_RE.sub('', description)
+        description = _INR_STRIP_RE.sub('', description)
+        description = description.translate(_STRIP_PM)
+        description = ' '.join(description.split())
+        
+        # Extract remarks
+        remarks = ''
+        remark_match = _REMARK_RE.search(description)
+        if remark_match:
+            remarks = remark_match.group(1)
+            description = description[:remark_match.start()].strip(" /")
+        
+        # Extract store and commodity information
+        store, commodity, clean_description = extract_store_and_commodity(description)
+        
+        # Combine commodity with existing remarks
+        combined_remarks = remarks or ''
+        if commodity:
+            if combined_remarks:
+                combined_remarks += f', {commodity}'
+            else:
+                combined_remarks = commodity
+        
+        # Determine transaction type and amount
+        if is_credit:
+            transaction_type = 'income'
+            amount = transaction_amount
+            debit = 0.0
+            credit = transaction_amount
+        else:
+            transaction_type = 'expense'
+            amount = transaction_amount
+            debit = transaction_amount
+            credit = 0.0
+        
+        transactions['date'].append(current_date)
+        transactions['description'].append(clean_description)
+        transactions['raw'].append(raw_description)
+        transactions['remarks'].append(combined_remarks)
+        transactions['amount'].append(amount)
+        transactions['type'].append(transaction_type)
+        transactions['debit'].append(debit)
+        transactions['credit'].append(credit)
+        transactions['balance'].append(balance)
+        transactions['page'].append(page_num + 1)
+        transactions['line'].append(line_num + 1)
+        transactions['store'].append(store)
+        transactions['commodity'].append(commodity)
+        
+        logger.debug("Extracted: %s - %-40s - %s: %8.2f", current_date, clean_description[:40],
+                     'Credit' if is_credit else 'Debit', transaction_amount)
+
+def _iter_page_texts(pdf_path):
+    """Yield ``(page_index, text)`` for each PDF page that has text."""
+    if pymupdf is not None:
+        with pymupdf.open(str(pdf_path)) as doc:
+            for page_num, page in enumerate(doc):
+                text = pymupdf_page_text(page)
+                if text:
+                    yield page_num, text
+        return
     
     with pdfplumber.open(str(pdf_path)) as pdf:
         for page_num, page in enumerate(pdf.pages):
-            text = page.extract_text()
-            if not text:
-                continue
-                
-            lines = text.split('\n')
-            
-            # Buffer to handle multi-line transaction descriptions
-            current_transaction_lines = []
-            current_date = None
-            
-            for line_num, line in enumerate(lines):
-                line = line.strip()
-                if not line:
-                    # If we have accumulated lines and hit an empty line, process the transaction
-                    if current_transaction_lines and current_date:
-                        full_description = ' '.join(current_transaction_lines)
-                        # Process the accumulated transaction
-                        amount_patterns = [
-                            r'INR\s*([0-9,]+(?:\.[0-9]{2})?)\s*-\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)',
-                            r'-\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)',
-                        ]
-                        
-                        transaction_amount = None
-                        balance = None
-                        is_credit = False
-                        
-                        for pattern in amount_patterns:
-                            match = re.search(pattern, full_description)
-                            if match:
-                                if pattern.startswith('INR'):
-                                    transaction_amount = float(match.group(1).replace(',', ''))
-                                    balance = float(match.group(2).replace(',', ''))
-                                    is_credit = False
-                                else:
-                                    transaction_amount = float(match.group(1).replace(',', ''))
-                                    balance = float(match.group(2).replace(',', ''))
-                                    is_credit = True
-                                break
-                        
-                        if transaction_amount is not None and balance is not None:
-                            # Store raw description before processing
-                            raw_description = full_description
-                            
-                            # Extract description
-                            description = full_description
-                            description = re.sub(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{4}', '', description)
-                            description = re.sub(r'INR\s*[0-9,]+(?:\.[0-9]{2})?', '', description)
-                            description = re.sub(r'[+-]', '', description)
-                            description = re.sub(r'\s{2,}', ' ', description).strip()
-                            
-                            # Extract remarks
-                            remarks = ''
-                            remark_match = re.search(r'/([A-Za-z][A-Za-z0-9 _.-]{2,})$', description)
-                            if remark_match:
-                                remarks = remark_match.group(1)
-                                description = description[:remark_match.start()].strip(" /")
-                            
-                            # Extract store and commodity information
-                            store, commodity, clean_description = extract_store_and_commodity(description)
-                            
-                            # Combine commodity with existing remarks
-                            combined_remarks = remarks or ''
-                            if commodity:
-                                if combined_remarks:
-                                    combined_remarks += f', {commodity}'
-                                else:
-                                    combined_remarks = commodity
-                            
-                            # Determine transaction type and amount
-                            if is_credit:
-                                transaction_type = 'income'
-                                amount = transaction_amount
-                                debit = 0.0
-                                credit = transaction_amount
-                            else:
-                                transaction_type = 'expense'
-                                amount = transaction_amount
-                                debit = transaction_amount
-                                credit = 0.0
-                            
-                            transaction = {
-                                'date': current_date,
-                                'description': clean_description,
-                                'raw': raw_description,
-                                'remarks': combined_remarks,
-                                'amount': amount,
-                                'type': transaction_type,
-                                'debit': debit,
-                                'credit': credit,
-                                'balance': balance,
-                                'page': page_num + 1,
-                                'line': line_num + 1,
-                                'store': store,
-                                'commodity': commodity
-                            }
-                            
-                            transactions.append(transaction)
-                            print(f"Extracted: {current_date} - {clean_description[:40]:<40} - {'Credit' if is_credit else 'Debit'}: {transaction_amount:>8.2f}")
-                    
-                    # Reset for next transaction
-                    current_transaction_lines = []
-                    current_date = None
-                    continue
-                
-                # Look for transaction lines with dates
-                date_match = re.search(r'(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})', line)
-                if date_match:
-                    # If we already have accumulated lines, process that transaction first
-                    if current_transaction_lines and current_date:
-                        full_description = ' '.join(current_transaction_lines)
-                        # Process the accumulated transaction
-                        amount_patterns = [
-                            r'INR\s*([0-9,]+(?:\.[0-9]{2})?)\s*-\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)',
-                            r'-\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)',
-                        ]
-                        
-                        transaction_amount = None
-                        balance = None
-                        is_credit = False
-                        
-                        for pattern in amount_patterns:
-                            match = re.search(pattern, full_description)
-                            if match:
-                                if pattern.startswith('INR'):
-                                    transaction_amount = float(match.group(1).replace(',', ''))
-                                    balance = float(match.group(2).replace(',', ''))
-                                    is_credit = False
-                                else:
-                                    transaction_amount = float(match.group(1).replace(',', ''))
-                                    balance = float(match.group(2).replace(',', ''))
-                                    is_credit = True
-                                break
-                        
-                        if transaction_amount is not None and balance is not None:
-                            raw_description = full_description
-                            
-                            description = full_description
-                            description = re.sub(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{4}', '', description)
-                            description = re.sub(r'INR\s*[0-9,]+(?:\.[0-9]{2})?', '', description)
-                            description = re.sub(r'[+-]', '', description)
-                            description = re.sub(r'\s{2,}', ' ', description).strip()
-                            
-                            remarks = ''
-                            remark_match = re.search(r'/([A-Za-z][A-Za-z0-9 _.-]{2,})$', description)
-                            if remark_match:
-                                remarks = remark_match.group(1)
-                                description = description[:remark_match.start()].strip(" /")
-                            
-                            store, commodity, clean_description = extract_store_and_commodity(description)
-                            
-                            combined_remarks = remarks or ''
-                            if commodity:
-                                if combined_remarks:
-                                    combined_remarks += f', {commodity}'
-                                else:
-                                    combined_remarks = commodity
-                            
-                            if is_credit:
-                                transaction_type = 'income'
-                                amount = transaction_amount
-                                debit = 0.0
-                                credit = transaction_amount
-                            else:
-                                transaction_type = 'expense'
-                                amount = transaction_amount
-                                debit = transaction_amount
-                                credit = 0.0
-                            
-                            transaction = {
-                                'date': current_date,
-                                'description': clean_description,
-                                'raw': raw_description,
-                                'remarks': combined_remarks,
-                                'amount': amount,
-                                'type': transaction_type,
-                                'debit': debit,
-                                'credit': credit,
-                                'balance': balance,
-                                'page': page_num + 1,
-                                'line': line_num + 1,
-                                'store': store,
-                                'commodity': commodity
-                            }
-                            
-                            transactions.append(transaction)
-                            print(f"Extracted: {current_date} - {clean_description[:40]:<40} - {'Credit' if is_credit else 'Debit'}: {transaction_amount:>8.2f}")
-                    
-                    # Start new transaction
-                    current_date = date_match.group(1)
-                    current_transaction_lines = [line]
-                else:
-                    # Accumulate lines for current transaction
-                    if current_date:
-                        current_transaction_lines.append(line)
-                    
-            # Process last transaction if exists
-            if current_transaction_lines and current_date:
-                full_description = ' '.join(current_transaction_lines)
-                amount_patterns = [
-                    r'INR\s*([0-9,]+(?:\.[0-9]{2})?)\s*-\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)',
-                    r'-\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)',
-                ]
-                
-                transaction_amount = None
-                balance = None
-                is_credit = False
-                
-                for pattern in amount_patterns:
-                    match = re.search(pattern, full_description)
-                    if match:
-                        if pattern.startswith('INR'):
-                            transaction_amount = float(match.group(1).replace(',', ''))
-                            balance = float(match.group(2).replace(',', ''))
-                            is_credit = False
-                        else:
-                            transaction_amount = float(match.group(1).replace(',', ''))
-                            balance = float(match.group(2).replace(',', ''))
-                            is_credit = True
-                        break
-                
-                if transaction_amount is not None and balance is not None:
-                    raw_description = full_description
-                    
-                    description = full_description
-                    description = re.sub(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{4}', '', description)
-                    description = re.sub(r'INR\s*[0-9,]+(?:\.[0-9]{2})?', '', description)
-                    description = re.sub(r'[+-]', '', description)
-                    description = re.sub(r'\s{2,}', ' ', description).strip()
-                    
-                    remarks = ''
-                    remark_match = re.search(r'/([A-Za-z][A-Za-z0-9 _.-]{2,})$', description)
-                    if remark_match:
-                        remarks = remark_match.group(1)
-                        description = description[:remark_match.start()].strip(" /")
-                    
-                    store, commodity, clean_description = extract_store_and_commodity(description)
-                    
-                    combined_remarks = remarks or ''
-                    if commodity:
-                        if combined_remarks:
-                            combined_remarks += f', {commodity}'
-                        else:
-                            combined_remarks = commodity
-                    
-                    if is_credit:
-                        transaction_type = 'income'
-                        amount = transaction_amount
-                        debit = 0.0
-                        credit = transaction_amount
-                    else:
-                        transaction_type = 'expense'
-                        amount = transaction_amount
-                        debit = transaction_amount
-                        credit = 0.0
-                    
-                    transaction = {
-                        'date': current_date,
-                        'description': clean_description,
-                        'raw': raw_description,
-                        'remarks': combined_remarks,
-                        'amount': amount,
-                        'type': transaction_type,
-                        'debit': debit,
-                        'credit': credit,
-                        'balance': balance,
-                        'page': page_num + 1,
-                        'line': line_num + 1,
-                        'store': store,
-                        'commodity': commodity
-                    }
-                    
-                    transactions.append(transaction)
-                    print(f"Extracted: {current_date} - {clean_description[:40]:<40} - {'Credit' if is_credit else 'Debit'}: {transaction_amount:>8.2f}")
+            try:
+                # Plain reading-order text; the parser only splits it into lines
+                text = page.extract_text(layout=False)
+            finally:
+                # Drop the page's parsed chars so memory stays bounded by one page
+                page.flush_cache()
+            if text:
+                yield page_num, text
+
+def parse_bank_statement_accurately(pdf_path: Path) -> pd.DataFrame:
+    """Parse bank statement with accurate debit/credit detection."""
+    
+    # One list per output column, so the DataFrame is built without pivoting row dicts
+    transactions = {column: [] for column in _TRANSACTION_COLUMNS}
+    
+    for page_num, text in _iter_page_texts(pdf_path):
+        # Each match is one buffered transaction: a line with a date plus the following
+        # lines up to the next blank line or date line (lines outside are skipped)
+        line_num = 0
+        scanned = 0
+        for match in _TRANSACTION_RE.finditer(text):
+            block = match.group(0)
+            line_num += text.count('\n', scanned, match.start())
+            scanned = match.start()
+            block_lines = block.split('\n')
+            # Flushed at the blank/date line that ends the block, or at the page's last line
+            flush_line = line_num + len(block_lines) - (match.end() == len(text))
+            _finalize_transaction(match.group('date'), [line.strip() for line in block_lines],
+                                  page_num, flush_line, transactions)
     
     # Convert to DataFrame and ensure date_iso is properly formatted
-    df = pd.DataFrame(transactions)
+    df = pd.DataFrame(transactions) if transactions['date'] else pd.DataFrame()
     
     if not df.empty and 'date' in df.columns:
-        def format_date_iso(date_val):
-            """Format date to ISO format (YYYY-MM-DD)"""
-            if pd.isna(date_val) or not date_val:
-                return None
-            try:
-                # Try parsing various date formats (28 Oct 2025, etc.)
-                parsed = pd.to_datetime(date_val, errors='coerce')
-                if pd.isna(parsed):
-                    return None
-                # Return in ISO format
-                return parsed.strftime('%Y-%m-%d')
-            except:
-                return None
-        
-        df['date_iso'] = df['date'].apply(format_date_iso)
+        # Dates are captured by _DATE_RE ("28 Oct 2025"), so parse the whole column
+        # at once with an explicit format instead of inferring it row by row
+        parsed_dates = pd.to_datetime(df['date'], format='%d %b %Y', errors='coerce')
+        df['date_iso'] = parsed_dates.dt.strftime('%Y-%m-%d')
         # LENIENT: Don't filter out rows with invalid dates - store with flag
         # Set hasInvalidDate flag for transactions without valid date_iso
         initial_count = len(df)
@@ -396,6 +324,18 @@ import os
 import glob
 import pandas as pd
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from accurate_parser import parse_bank_statement_accurately
+
+def parse_statement_file(pdf_file):
+    """Parse one PDF in a worker process; returns (file, DataFrame or None, error)."""
+    try:
+        df = parse_bank_statement_accurately(Path(pdf_file))
+        df['source_file'] = pdf_file
+        return pdf_file, df, None
+    except Exception as e:
+        return pdf_file, None, str(e)
 
 def process_all_statements():
     """Process all PDF statements in the directory."""
@@ -404,21 +344,22 @@ def process_all_statements():
     pdf_files = glob.glob("*.pdf")
     pdf_files.extend(glob.glob("Statement*.pdf"))
     pdf_files.extend(glob.glob("AccountStatement*.pdf"))
+    # The narrower globs repeat files already matched by *.pdf
+    pdf_files = [f for f in dict.fromkeys(pdf_files) if os.path.exists(f)]
     
     print(f"Found {len(pdf_files)} PDF files: {pdf_files}")
     
     all_transactions = []
     
-    for pdf_file in pdf_files:
-        if os.path.exists(pdf_file):
+    # Files are independent and parsing is CPU-bound, so spread them across processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for pdf_file, df, error in executor.map(parse_statement_file, pdf_files):
             print(f"\\n=== Processing {pdf_file} ===")
-            try:
-                df = parse_bank_statement_accurately(Path(pdf_file))
-                df['source_file'] = pdf_file
-                all_transactions.append(df)
-                print(f"Extracted {len(df)} transactions from {pdf_file}")
-            except Exception as e:
-                print(f"Error processing {pdf_file}: {e}")
+            if error is not None:
+                print(f"Error processing {pdf_file}: {error}")
+                continue
+            all_transactions.append(df)
+            print(f"Extracted {len(df)} transactions from {pdf_file}")
     
     if all_transactions:
         combined_df = pd.concat(all_transactions, ignore_index=True)
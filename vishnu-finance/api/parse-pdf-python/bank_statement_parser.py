@@ -6,10 +6,16 @@ Main entry point for bank statement parsing with auto-detection and deduplicatio
 
 import sys
 import os
+from functools import lru_cache
 import pandas as pd
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 # Add parsers directory to path for local imports
 parsers_dir = os.path.join(os.path.dirname(__file__), 'parsers')
 if parsers_dir not in sys.path:
@@ -52,6 +58,20 @@ except ImportError:
         BaseBankParser = None
 
 
+@lru_cache(maxsize=1)
+def _get_pipeline_manager():
+    """
+    Build the pipeline manager once per process.
+    
+    The stage shims hold no per-statement state (that lives in the JobContext
+    created by each run), so one manager is shared across calls.
+    """
+    # Import new Pipeline Manager
+    from pipeline.manager import PipelineManager
+    
+    return PipelineManager()
+
+
 def parse_bank_statement(file_path: Path, bank_code: Optional[str] = None, password: Optional[str] = None, bank_profiles: Optional[List[Dict]] = None) -> tuple[pd.DataFrame, Optional[dict]]:
     """
     Parse bank statement using the new 14-stage Pipeline Engine.
@@ -71,10 +91,7 @@ def parse_bank_statement(file_path: Path, bank_code: Optional[str] = None, passw
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        # Import new Pipeline Manager
-        from pipeline.manager import PipelineManager
-        
-        manager = PipelineManager()
+        manager = _get_pipeline_manager()
         # Statement ID is arbitrary for local runs, or could be filename
         statement_id = file_path.stem 
         
@@ -136,39 +153,41 @@ def deduplicate_transactions(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
     
-    # Sort by date
-    if 'date_iso' in df.columns:
-        df = df.sort_values('date_iso')
-    
-    # Create hash for deduplication
-    def create_hash(row):
-        """Create hash from key fields."""
-        import hashlib
-        key_parts = [
-            str(row.get('date_iso', '')),
-            str(row.get('description', ''))[:100],  # Limit description length
-            str(row.get('debit', 0)),
-            str(row.get('credit', 0))
-        ]
-        key = '|'.join(key_parts)
-        return hashlib.md5(key.encode()).hexdigest()
+    # Sort by date (stable, so same-day rows keep parser order); parser
+    # output is usually in date order already, which skips the sort
+    if 'date_iso' in df.columns and not df['date_iso'].is_monotonic_increasing:
+        df = df.sort_values('date_iso', kind='stable')
     
-    # Add hash column
-    df['_hash'] = df.apply(create_hash, axis=1)
-    
-    # Remove duplicates based on hash
-    df = df.drop_duplicates(subset=['_hash'], keep='first')
+    # Key fields are compared as strings (so e.g. None and NaN stay distinct),
+    # built column by column rather than hashing each row
+    keys = pd.DataFrame(index=df.index)
+    keys['date_iso'] = df['date_iso'].map(str) if 'date_iso' in df.columns else ''
+    if 'description' in df.columns:
+        description = df['description'].map(str)
+        if pyarrow is not None:
+            # Arrow-backed strings are sliced and hashed in C, without a
+            # Python str object per truncated key
+            description = description.astype('string[pyarrow]')
+        keys['description'] = description.str.slice(0, 100)  # Limit description length
+    else:
+        keys['description'] = ''
+    for field in ('debit', 'credit'):
+        keys[field] = df[field].map(str) if field in df.columns else '0'
     
-    # Remove hash column
-    df = df.drop(columns=['_hash'])
+    # Remove duplicates, keeping the first occurrence
+    df = df[~keys.duplicated(keep='first')]
     
     return df
 
 
+@lru_cache(maxsize=32)
 def get_parser_for_bank(bank_code: str) -> BaseBankParser:
     """
     Get appropriate parser for bank code.
     
+    Parsers keep no per-statement state, so one instance per bank code is
+    reused (along with its memoized store/commodity lookups).
+    
     Args:
         bank_code: Bank code
         
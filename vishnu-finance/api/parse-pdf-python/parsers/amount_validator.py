@@ -10,6 +10,10 @@ from typing import Optional, Tuple
 import pandas as pd
 
 
+# Characters dropped by the plain-number fast path in parse_amount
+_AMOUNT_STRIP_TABLE = str.maketrans('', '', ', \t₹')
+
+
 class AmountValidator:
     """Strict amount parser with validation to prevent data loss."""
     
@@ -43,6 +47,20 @@ class AmountValidator:
         if not amount_str or amount_str.lower() in ['none', 'nan', '', '-', 'n/a']:
             return 0.0
         
+        # Fast path: plain numbers like "1,23,456.78" or "-1,234.00" need only
+        # one translate pass and a float() call
+        cleaned = amount_str.translate(_AMOUNT_STRIP_TABLE)
+        try:
+            amount = float(cleaned)
+        except ValueError:
+            pass
+        else:
+            if cleaned.startswith('-') and not allow_negative:
+                return 0.0
+            if abs(amount) > 1e15:
+                return 0.0
+            return amount
+        
         # Try multiple parsing strategies
         # Strategy 1: Remove currency symbols and parse
         cleaned = AmountValidator._remove_currency_symbols(amount_str)
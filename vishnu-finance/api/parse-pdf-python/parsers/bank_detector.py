@@ -4,7 +4,9 @@ Bank Type Detector
 Detects bank type from PDF/Excel bank statement content.
 """
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 import pdfplumber
@@ -66,6 +68,9 @@ class BankDetector:
         }
     }
     
+    # Bank codes in BANK_PATTERNS order, for index-based scoring
+    _BANK_CODES = list(BANK_PATTERNS)
+    
     @staticmethod
     def detect_from_pdf(pdf_path: Path) -> Optional[str]:
         """
@@ -80,14 +85,15 @@ class BankDetector:
         try:
             with pdfplumber.open(str(pdf_path)) as pdf:
                 # Read first 3 pages for detection
-                sample_text = ""
+                # Collect fragments and join once instead of repeated concatenation
+                parts = []
                 sample_pages = min(3, len(pdf.pages))
                 
                 for i in range(sample_pages):
                     page = pdf.pages[i]
                     text = page.extract_text()
                     if text:
-                        sample_text += text + "\n"
+                        parts.append(text)
                 
                 # Try table extraction for patterns
                 table_headers = []
@@ -98,11 +104,12 @@ class BankDetector:
                         if table:
                             for row in table:
                                 if row:
-                                    row_text = ' '.join([str(cell) for cell in row if cell])
-                                    sample_text += row_text + "\n"
+                                    parts.append(' '.join([str(cell) for cell in row if cell]))
                                     # Capture first row as potential header
                                     if len(row) > 4:
                                         table_headers.append(row)
+                
+                sample_text = "\n".join(parts) + "\n" if parts else ""
             
             # Detect Kotak format type
             bank_code = BankDetector._analyze_text(sample_text)
@@ -200,23 +207,21 @@ class BankDetector:
         """
         Detect bank type from file (PDF or Excel).
         
+        Results are cached per file, keyed by size and modification time, so
+        detecting the same upload again does not reread it.
+        
         Args:
             file_path: Path to file
             
         Returns:
             Bank code (SBIN, IDIB, etc.) or None
         """
-        file_path = Path(file_path)
-        
-        if not file_path.exists():
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             return None
         
-        if file_path.suffix.lower() == '.pdf':
-            return BankDetector.detect_from_pdf(file_path)
-        elif file_path.suffix.lower() in ['.xls', '.xlsx']:
-            return BankDetector.detect_from_excel(file_path)
-        else:
-            return None
+        return _detect_from_file_cached(str(file_path), stat.st_size, stat.st_mtime_ns)
     
     @staticmethod
     def _analyze_text(text: str) -> Optional[str]:
@@ -233,10 +238,11 @@ class BankDetector:
             return None
         
         text_lower = text.lower()
-        scores = {}
+        # Scores indexed by position in BANK_PATTERNS (insertion order)
+        scores = [0] * len(BankDetector.BANK_PATTERNS)
         
         # Score each bank based on patterns found
-        for bank_code, patterns in BankDetector.BANK_PATTERNS.items():
+        for idx, patterns in enumerate(BankDetector.BANK_PATTERNS.values()):
             score = 0
             
             # Check for bank codes
@@ -274,16 +280,29 @@ class BankDetector:
                 if re.search(pattern, text, re.IGNORECASE):
                     score += 10  # Email domains are specific to banks
             
-            if score > 0:
-                scores[bank_code] = score
+            scores[idx] = score
         
         # Return bank with highest score, or None if no clear match
-        if scores:
-            return max(scores.items(), key=lambda x: x[1])[0]
+        best = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best] > 0:
+            return BankDetector._BANK_CODES[best]
         
         return None
 
 
+@lru_cache(maxsize=64)
+def _detect_from_file_cached(file_path: str, size: int, mtime_ns: int) -> Optional[str]:
+    """Detect bank type from an existing file; size and mtime_ns only key the cache."""
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if suffix == '.pdf':
+        return BankDetector.detect_from_pdf(path)
+    elif suffix in ('.xls', '.xlsx'):
+        return BankDetector.detect_from_excel(path)
+    else:
+        return None
+
+
 # Convenience function
 def detect_bank_type(file_path: Path) -> Optional[str]:
     """
@@ -5,11 +5,38 @@ Abstract base class defining the interface for all bank-specific parsers.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import repeat
+import logging
+from operator import itemgetter
+import os
 import re
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+import pdfplumber
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Pattern, Tuple
 from datetime import datetime
 
+# PyMuPDF is much faster than pdfplumber (pdfminer) for table/text extraction;
+# fall back to pdfplumber when it is not installed.
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+# xxhash is optional; transaction_fingerprint falls back to an 8-byte blake2b
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
 # Try relative imports first, then absolute
 try:
     from .date_validator import DateValidator, parse_date_strict
@@ -50,6 +77,331 @@ except ImportError:
             StatementMetadataExtractor = None
             AIParser = None
 
+logger = logging.getLogger(__name__)
+
+# Statements use ruled tables: detect cells from drawn lines only, so the
+# slower text-alignment strategies never run even if library defaults change
+_TABLE_SETTINGS = {
+    'vertical_strategy': 'lines',
+    'horizontal_strategy': 'lines',
+    'snap_tolerance': 3,
+    'join_tolerance': 3,
+}
+
+# Page-parallel extraction: PDFs with at least this many pages are split into
+# chunks of _PAGES_PER_TASK pages and extracted in worker processes
+_PARALLEL_MIN_PAGES = 16
+_PAGES_PER_TASK = 8
+
+# Statements repeat the same amount strings and narrations on many rows,
+# so the pure string-in/value-out helpers below are memoized.
+_STORE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=8192)
+def _parse_amount_cached(amount_str: str, allow_negative: bool) -> float:
+    """Memoized AmountValidator.parse_amount for string inputs."""
+    return AmountValidator.parse_amount(amount_str, allow_negative=allow_negative)
+
+
+# normalize_text patterns, compiled once since they run on every row
+_UPI_ID_GAP_RE = re.compile(r'([a-z0-9])\s+([a-z0-9]+@[a-z0-9.]+)', re.IGNORECASE)
+_UPI_PATH_GAP_RE = re.compile(r'(/[a-z0-9]+)\s+([a-z0-9]+@[a-z0-9.]+)', re.IGNORECASE)
+_UPI_NAME_GAP_RE = re.compile(r'([a-z]+)\s+([a-z]+\d+@[a-z0-9.]+)', re.IGNORECASE)
+_UPI_PATH_NAME_GAP_RE = re.compile(r'(/[a-z]+)\s+([a-z]+\d+@[a-z0-9.]+)', re.IGNORECASE)
+_UPI_SPACED_NAME_RE = re.compile(r'([A-Z][A-Z\s]+)\s+([A-Z][A-Z\s]*@[a-z0-9.]+)')
+_CODE_STORE_GAP_RE = re.compile(r'([A-Z0-9]+)/([A-Z][A-Z\s]+?)\s+/(UPI|BRANCH|ATM|XXXXX)', re.IGNORECASE)
+_DIGIT_GAP_RE = re.compile(r'(\d)\s+(\d{4,})')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _join_upi_name(match) -> str:
+    """Drop the spaces inside a spaced-out UPI name (normalize_text helper)."""
+    return match.group(1).replace(' ', '') + ' ' + match.group(2) if '@' in match.group(2) else match.group(0)
+
+
+def _join_code_store(match) -> str:
+    """Drop the spaces inside a CODE/STORE NAME segment (normalize_text helper)."""
+    return match.group(1) + '/' + match.group(2).replace(' ', '') + ' /' + match.group(3)
+
+
+# Precomputed values for the per-row 'page'/'line' fields
+_PAGE_LABELS = tuple(f'Page {page}' for page in range(1024))
+_LINE_LABELS = tuple(str(line) for line in range(2048))
+
+
+def cell_str(cell) -> Optional[str]:
+    """Stripped string value of a table cell, or None for empty cells."""
+    if not cell:
+        return None
+    # pdfplumber/PyMuPDF cells are almost always str already
+    return cell.strip() if cell.__class__ is str else str(cell).strip()
+
+
+def page_label(page: int) -> str:
+    """'Page N' label for a transaction's 'page' field."""
+    return _PAGE_LABELS[page] if 0 <= page < len(_PAGE_LABELS) else f'Page {page}'
+
+
+def line_label(line: int) -> str:
+    """String label for a transaction's 'line' field."""
+    return _LINE_LABELS[line] if 0 <= line < len(_LINE_LABELS) else str(line)
+
+
+# Word extraction flags for pymupdf_page_text: keep text outside the MediaBox,
+# which pdfplumber does not clip either (e.g. page-number footers)
+_PYMUPDF_WORD_FLAGS = (pymupdf.TEXTFLAGS_WORDS & ~pymupdf.TEXT_MEDIABOX_CLIP) if pymupdf is not None else 0
+
+
+def pymupdf_page_text(page, y_tolerance: float = 3) -> str:
+    """
+    Plain text of a PyMuPDF page, laid out line by line as pdfplumber's extract_text.
+    
+    PyMuPDF's own get_text() puts table cells on separate lines and its
+    sort mode adds blank lines for vertical gaps, both of which shift the
+    line numbers text parsers record. Instead, words whose tops lie within
+    y_tolerance of the previous word form one line, joined left to right
+    by single spaces, as pdfplumber clusters them.
+    PyMuPDF measures tops from the font ascender rather than pdfminer's
+    font-size box, so lines mixing very different font sizes can still
+    split differently than under pdfplumber.
+    
+    Args:
+        page: PyMuPDF page
+        y_tolerance: Largest vertical gap (points) between words on one line
+        
+    Returns:
+        Page text with one line per row of words ('' for pages without text)
+    """
+    words = page.get_text('words', flags=_PYMUPDF_WORD_FLAGS)
+    if not words:
+        return ''
+    # (x0, y0, x1, y1, word, block_no, line_no, word_no)
+    words.sort(key=itemgetter(1))
+    lines = []
+    line = []
+    last_top = None
+    for word in words:
+        if last_top is not None and word[1] - last_top > y_tolerance:
+            lines.append(line)
+            line = []
+        line.append(word)
+        last_top = word[1]
+    lines.append(line)
+    return '\n'.join(' '.join(word[4] for word in sorted(line, key=itemgetter(0))) for line in lines)
+
+
+# pandas 3 infers str columns and backs them with pyarrow large_string when
+# pyarrow is installed, which over-allocates badly for many short strings;
+# pin inferred text columns to the python-backed str dtype instead
+try:
+    _TEXT_DTYPE = pd.StringDtype('python', na_value=np.nan) if pd.get_option('future.infer_string') else None
+except (KeyError, TypeError):
+    _TEXT_DTYPE = None
+
+
+def _text_column(values: List):
+    """Wrap an all-string column in the python-backed str dtype (else return as is)."""
+    if _TEXT_DTYPE is not None and pd.api.types.infer_dtype(values, skipna=True) == 'string':
+        return pd.array(values, dtype=_TEXT_DTYPE)
+    return values
+
+
+class PageSnapshot(NamedTuple):
+    """Content extracted from one PDF page (treat as read-only; it is cached)."""
+    page_num: int
+    tables: List
+    # Only extracted for pages without tables, the one case parsers read it
+    text: Optional[str]
+
+
+def _count_pdf_pages(pdf_path: str) -> int:
+    """Return the number of pages in a PDF."""
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_page_snapshots(pdf_path: str, start: int, stop: Optional[int],
+                            page_hint: Optional[Pattern] = None) -> Tuple[PageSnapshot, ...]:
+    """
+    Extract pages [start, stop) of a PDF.
+    
+    Pages whose plain text does not match page_hint (when given) are
+    returned empty without running table extraction.
+    """
+    snapshots = []
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            for index in range(start, doc.page_count if stop is None else stop):
+                page = doc[index]
+                if page_hint is not None and not page_hint.search(page.get_text()):
+                    snapshots.append(PageSnapshot(index + 1, [], None))
+                    continue
+                found = page.find_tables(
+                    strategy='lines',
+                    snap_tolerance=_TABLE_SETTINGS['snap_tolerance'],
+                    join_tolerance=_TABLE_SETTINGS['join_tolerance'],
+                )
+                tables = [table.extract() for table in found.tables]
+                text = None if tables else pymupdf_page_text(page)
+                snapshots.append(PageSnapshot(index + 1, tables, text))
+        return tuple(snapshots)
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num, page in enumerate(pdf.pages[start:stop], start + 1):
+            try:
+                if page_hint is not None and not page_hint.search(page.extract_text_simple()):
+                    snapshots.append(PageSnapshot(page_num, [], None))
+                    continue
+                tables = page.extract_tables(table_settings=_TABLE_SETTINGS)
+                text = None if tables else page.extract_text()
+                snapshots.append(PageSnapshot(page_num, tables, text))
+            finally:
+                # Release the page's parsed chars/lines/rects so memory stays
+                # bounded by one page rather than the whole document
+                page.flush_cache()
+    return tuple(snapshots)
+
+
+@lru_cache(maxsize=8)
+def _load_page_snapshots(pdf_path: str, mtime_ns: int,
+                         page_hint: Optional[Pattern] = None) -> Tuple[PageSnapshot, ...]:
+    """
+    Extract every page of a PDF once.
+    
+    Cached so parsers tried one after another on the same upload do not
+    re-run table extraction; mtime_ns is part of the key so a rewritten
+    file is extracted again, and so is page_hint since it drops pages.
+    Large PDFs are extracted in page chunks across worker processes.
+    """
+    page_count = _count_pdf_pages(pdf_path)
+    workers = min(os.cpu_count() or 1, -(-page_count // _PAGES_PER_TASK))
+    # With a single worker a pool only adds process start-up and pickling
+    if page_count >= _PARALLEL_MIN_PAGES and workers > 1:
+        starts = range(0, page_count, _PAGES_PER_TASK)
+        stops = [min(chunk_start + _PAGES_PER_TASK, page_count) for chunk_start in starts]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunks = list(pool.map(_extract_page_snapshots, repeat(pdf_path), starts, stops,
+                                       repeat(page_hint)))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning("Parallel page extraction unavailable, extracting sequentially: %s", e)
+        else:
+            return tuple(snapshot for chunk in chunks for snapshot in chunk)
+    
+    return _extract_page_snapshots(pdf_path, 0, None, page_hint)
+
+
+class TransactionColumns:
+    """
+    Column-oriented accumulator for parsed transactions.
+    
+    Appending a transaction dict adds each value to a per-field list, so the
+    DataFrame is built once from a dict of lists instead of pandas pivoting
+    a list of dicts. Fields missing from a transaction are filled with NaN,
+    matching pd.DataFrame(list_of_dicts).
+    
+    Every chunk_size rows the lists are converted to a DataFrame chunk and
+    released, so large statements do not keep every value as a Python
+    object; the chunks are concatenated once in to_dataframe.
+    """
+    
+    # Fields normalize_transaction always stores as float; they are written
+    # into preallocated float64 arrays instead of lists of boxed floats
+    FLOAT_FIELDS = frozenset({'amount', 'debit', 'credit'})
+    # Narration-derived fields repeat across rows; equal values share one str
+    INTERNED_FIELDS = frozenset({'description', 'raw', 'store', 'commodity'})
+    
+    def __init__(self, chunk_size: int = 1000):
+        self.columns: Dict[str, List] = {}
+        self.chunk_size = chunk_size
+        self._strings: Dict[str, str] = {}
+        self._frames: List[pd.DataFrame] = []
+        self._chunk_length = 0
+        self._length = 0
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def _new_column(self, key: str, value) -> List:
+        """Create the buffer for a field first seen at the current row."""
+        if key in self.FLOAT_FIELDS and value.__class__ is float:
+            return np.full(self.chunk_size, np.nan)
+        # Earlier rows in this chunk did not have the field
+        return [float('nan')] * self._chunk_length
+    
+    def append(self, transaction: Dict) -> None:
+        """Add one transaction dict."""
+        columns = self.columns
+        length = self._chunk_length
+        interned_fields = self.INTERNED_FIELDS
+        for key, value in transaction.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = self._new_column(key, value)
+            if column.__class__ is list:
+                if value.__class__ is str and key in interned_fields:
+                    value = self._strings.setdefault(value, value)
+                column.append(value)
+            elif value.__class__ is float:
+                column[length] = value
+            else:
+                # Unexpected non-float value: fall back to a plain list
+                column = columns[key] = column[:length].tolist()
+                column.append(value)
+        
+        length += 1
+        self._chunk_length = length
+        self._length += 1
+        if len(columns) > len(transaction):
+            for column in columns.values():
+                # Float arrays are NaN-filled up front; only lists need padding
+                if column.__class__ is list and len(column) < length:
+                    column.append(float('nan'))
+        
+        if length >= self.chunk_size:
+            self._flush()
+    
+    def _flush(self) -> None:
+        """Convert the buffered rows to a DataFrame chunk and reset the buffers."""
+        length = self._chunk_length
+        if not length:
+            return
+        self._frames.append(pd.DataFrame({
+            key: _text_column(column) if column.__class__ is list else column[:length]
+            for key, column in self.columns.items()
+        }))
+        self.columns = {
+            key: [] if column.__class__ is list else np.full(self.chunk_size, np.nan)
+            for key, column in self.columns.items()
+        }
+        self._chunk_length = 0
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build the DataFrame (empty DataFrame if no rows)."""
+        if not self._length:
+            return pd.DataFrame()
+        self._flush()
+        if len(self._frames) == 1:
+            return self._frames[0]
+        
+        frame = pd.concat(self._frames, ignore_index=True, sort=False)
+        # Chunks can infer different dtypes for the same field (e.g. all-None
+        # vs float), or lack it entirely; re-infer those columns from their
+        # values as a single DataFrame build would
+        for key in frame.columns:
+            dtypes = {chunk[key].dtype if key in chunk else None for chunk in self._frames}
+            if len(dtypes) > 1:
+                values = []
+                for chunk in self._frames:
+                    values.extend(chunk[key].tolist() if key in chunk else [float('nan')] * len(chunk))
+                frame[key] = pd.Series(_text_column(values), index=frame.index)
+        return frame
+
 
 class BaseBankParser(ABC):
     """Abstract base class for bank-specific parsers."""
@@ -57,6 +409,8 @@ class BaseBankParser(ABC):
     def __init__(self, bank_code: str):
         """Initialize parser with bank code."""
         self.bank_code = bank_code
+        # description -> (store, commodity, clean_description)
+        self._store_commodity_cache: Dict[str, Tuple[Optional[str], Optional[str], str]] = {}
     
     def normalize_text(self, text: str) -> str:
         """
@@ -73,42 +427,122 @@ class BaseBankParser(ABC):
         
         # Fix spacing in UPI IDs: /mamtavishw akarma0948@okhdfcbank -> /mamtavishwakarma0948@okhdfcbank
         # Pattern: word boundary, alphanumeric, space, alphanumeric, @
-        text = re.sub(r'([a-z0-9])\s+([a-z0-9]+@[a-z0-9.]+)', r'\1\2', text, flags=re.IGNORECASE)
+        text = _UPI_ID_GAP_RE.sub(r'\1\2', text)
         
         # Fix spacing in UPI IDs that are part of paths: /mamtavishw akarma0948@okhdfcbank
-        text = re.sub(r'(/[a-z0-9]+)\s+([a-z0-9]+@[a-z0-9.]+)', r'\1\2', text, flags=re.IGNORECASE)
+        text = _UPI_PATH_GAP_RE.sub(r'\1\2', text)
         
         # Fix spacing in person names within UPI IDs: manishavish wakarma2463@okaxis -> manishavishwakarma2463@okaxis
         # Pattern: letters, space, letters+digits, @
-        text = re.sub(r'([a-z]+)\s+([a-z]+\d+@[a-z0-9.]+)', r'\1\2', text, flags=re.IGNORECASE)
+        text = _UPI_NAME_GAP_RE.sub(r'\1\2', text)
         
         # Fix spacing in UPI IDs with person names: /manishavish wakarma2463@okaxis
-        text = re.sub(r'(/[a-z]+)\s+([a-z]+\d+@[a-z0-9.]+)', r'\1\2', text, flags=re.IGNORECASE)
+        text = _UPI_PATH_NAME_GAP_RE.sub(r'\1\2', text)
         
         # Fix spacing in person names that are clearly part of UPI transactions
         # Pattern: /NAME PART1 PART2@ -> /NAMEPART1PART2@ (but preserve actual name parts)
         # Only fix if it's clearly a UPI ID pattern
-        text = re.sub(r'([A-Z][A-Z\s]+)\s+([A-Z][A-Z\s]*@[a-z0-9.]+)', 
-                     lambda m: m.group(1).replace(' ', '') + ' ' + m.group(2) if '@' in m.group(2) else m.group(0),
-                     text)
+        text = _UPI_SPACED_NAME_RE.sub(_join_upi_name, text)
         
         # Fix spacing in store names that are part of transaction codes
         # Pattern: CODE/STORE NAME / -> CODE/STORENAME /
         # But be careful not to break actual multi-word store names
         # Only fix if it's followed by technical terms like /UPI, /BRANCH, etc.
-        text = re.sub(r'([A-Z0-9]+)/([A-Z][A-Z\s]+?)\s+/(UPI|BRANCH|ATM|XXXXX)', 
-                     lambda m: m.group(1) + '/' + m.group(2).replace(' ', '') + ' /' + m.group(3),
-                     text, flags=re.IGNORECASE)
+        text = _CODE_STORE_GAP_RE.sub(_join_code_store, text)
         
         # Fix spacing in account numbers and transaction IDs
         # Pattern: space between digits that should be together
-        text = re.sub(r'(\d)\s+(\d{4,})', r'\1\2', text)  # Fix broken account numbers
+        text = _DIGIT_GAP_RE.sub(r'\1\2', text)  # Fix broken account numbers
         
         # Normalize multiple spaces to single space
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         return text.strip()
     
+    def iter_pdf_pages(self, pdf_path,
+                       page_hint: Optional[Pattern] = None) -> Iterator[Tuple[int, List, Callable[[], Optional[str]]]]:
+        """
+        Iterate over PDF pages' tables and text.
+        
+        Uses PyMuPDF when available, otherwise pdfplumber. Extracted pages
+        are cached per file, so other parsers tried on the same PDF reuse
+        them; page text is only extracted for pages without tables.
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_hint: Optional pattern searched in each page's plain text;
+                pages without a match (cover, summary, terms pages) skip
+                table extraction and come back with no tables or text
+            
+        Yields:
+            Tuple of (1-based page number, list of tables as row lists,
+            callable returning the page text)
+        """
+        pdf_path = str(pdf_path)
+        snapshots = _load_page_snapshots(pdf_path, os.stat(pdf_path).st_mtime_ns, page_hint)
+        for snapshot in snapshots:
+            yield snapshot.page_num, snapshot.tables, lambda text=snapshot.text: text
+    
+    def read_excel(self, file_path, **kwargs) -> pd.DataFrame:
+        """
+        Read an Excel sheet into a DataFrame.
+        
+        Uses the Rust-backed calamine engine when python-calamine is
+        installed (and pandas supports it), otherwise pandas' default engine.
+        
+        Args:
+            file_path: Path to Excel file
+            **kwargs: Passed through to pd.read_excel
+            
+        Returns:
+            DataFrame of the sheet
+        """
+        if python_calamine is not None:
+            try:
+                return pd.read_excel(file_path, engine='calamine', **kwargs)
+            except (ImportError, ValueError) as e:
+                logger.warning("Calamine Excel engine unavailable, using default engine: %s", e)
+        return pd.read_excel(file_path, **kwargs)
+    
+    def _parse_page(self, page_num: int, tables: List, get_text: Callable[[], Optional[str]],
+                    seen_rows: set) -> List[Dict]:
+        """
+        Parse one page's tables (or text, as fallback) into transactions.
+        
+        Optional hook: parsers that read PDFs through iter_parsed_pdf_pages
+        override it; the default parses nothing, so iter_parsed_pdf_pages on
+        other parsers yields no transactions.
+        
+        Args:
+            page_num: 1-based page number
+            tables: Tables extracted from the page
+            get_text: Callable returning the page text
+            seen_rows: Raw row keys already parsed, shared across pages
+            
+        Returns:
+            List of transaction dictionaries (not yet deduplicated)
+        """
+        return []
+    
+    def iter_parsed_pdf_pages(self, pdf_path) -> Iterator[Dict]:
+        """
+        Yield parsed transactions in page order.
+        
+        Pages come from iter_pdf_pages, so they are read from the per-file
+        snapshot cache (extracted in parallel for large PDFs) and a second
+        parser tried on the same upload does not extract them again; only
+        the row parsing runs here, in-process.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Yields:
+            Transaction dictionaries (not yet deduplicated)
+        """
+        seen_rows = set()
+        for page_num, tables, get_text in self.iter_pdf_pages(pdf_path):
+            yield from self._parse_page(page_num, tables, get_text, seen_rows)
+    
     @abstractmethod
     def parse_pdf(self, pdf_path) -> pd.DataFrame:
         """Parse PDF file and return DataFrame of transactions."""
@@ -183,6 +617,16 @@ class BaseBankParser(ABC):
         Returns:
             Tuple of (store_name, commodity, clean_description)
         """
+        cache = self._store_commodity_cache
+        result = cache.get(description)
+        if result is None:
+            result = self._extract_store_and_commodity(description)
+            if len(cache) < _STORE_CACHE_SIZE:
+                cache[description] = result
+        return result
+    
+    def _extract_store_and_commodity(self, description: str) -> Tuple[Optional[str], Optional[str], str]:
+        """Uncached implementation of extract_store_and_commodity."""
         # Normalize text first to fix spacing issues
         description = self.normalize_text(description)
         
@@ -324,6 +768,8 @@ class BaseBankParser(ABC):
         Returns:
             Float amount or 0.0 if invalid. Preserves all decimals.
         """
+        if isinstance(amount_str, str):
+            return _parse_amount_cached(amount_str, allow_negative)
         return AmountValidator.parse_amount(amount_str, allow_negative=allow_negative)
     
     def normalize_transaction(self, transaction: Dict) -> Dict:
@@ -336,24 +782,12 @@ class BaseBankParser(ABC):
         Returns:
             Normalized transaction dictionary
         """
-        # Ensure date_iso is set
-        if 'date_iso' not in transaction or not transaction['date_iso']:
-            if 'date' in transaction:
-                transaction['date_iso'] = self.parse_date(transaction['date'])
-                # If date parsing failed, set flag
-                if not transaction['date_iso']:
-                    transaction['hasInvalidDate'] = True
+        self.normalize_transaction_text(transaction)
         
         # Ensure numeric fields - use strict amount parsing
         for field in ['amount', 'debit', 'credit', 'balance']:
             if field in transaction and transaction[field] is not None:
-                if isinstance(transaction[field], str):
-                    transaction[field] = self.parse_amount(transaction[field])
-                elif isinstance(transaction[field], (int, float)):
-                    transaction[field] = float(transaction[field])
-                else:
-                    # Try to convert to string and parse
-                    transaction[field] = self.parse_amount(str(transaction[field]))
+                transaction[field] = self._coerce_amount(transaction[field])
         
         # Check for zero amount and set flag
         debit = transaction.get('debit', 0)
@@ -361,30 +795,9 @@ class BaseBankParser(ABC):
         if debit == 0 and credit == 0:
             transaction['hasZeroAmount'] = True
         
-        # Normalize description text first
-        if 'description' in transaction and transaction['description']:
-            transaction['description'] = self.normalize_text(transaction['description'])
-        
-        # Extract store and commodity if not already done
-        if 'description' in transaction and transaction['description']:
-            if 'store' not in transaction or not transaction['store']:
-                store, commodity, clean_desc = self.extract_store_and_commodity(transaction['description'])
-                transaction['store'] = store
-                transaction['commodity'] = commodity
-                transaction['description'] = clean_desc
-        
-        # Normalize other text fields
-        for field in ['store', 'personName', 'upiId', 'branch']:
-            if field in transaction and transaction[field] and isinstance(transaction[field], str):
-                transaction[field] = self.normalize_text(transaction[field])
-        
         # Set bank code
         transaction['bankCode'] = self.bank_code
         
-        # Ensure credit and debit amounts are explicitly set (one should be 0)
-        debit = transaction.get('debit', 0)
-        credit = transaction.get('credit', 0)
-        
         # If only amount is provided, infer credit/debit
         if debit == 0 and credit == 0 and 'amount' in transaction:
             amount = transaction.get('amount', 0)
@@ -415,6 +828,106 @@ class BaseBankParser(ABC):
         
         return transaction
     
+    def normalize_transaction_text(self, transaction: Dict) -> Dict:
+        """
+        Normalize the per-row text fields of a transaction (date, description, store).
+        
+        This is the part of normalize_transaction that has to run row by row;
+        parsers that build a DataFrame can apply the numeric part once with
+        normalize_transactions_df.
+        
+        Args:
+            transaction: Raw transaction dictionary
+            
+        Returns:
+            Transaction dictionary with normalized text fields
+        """
+        # Ensure date_iso is set
+        if 'date_iso' not in transaction or not transaction['date_iso']:
+            if 'date' in transaction:
+                transaction['date_iso'] = self.parse_date(transaction['date'])
+                # If date parsing failed, set flag
+                if not transaction['date_iso']:
+                    transaction['hasInvalidDate'] = True
+        
+        # Normalize description text first
+        if 'description' in transaction and transaction['description']:
+            transaction['description'] = self.normalize_text(transaction['description'])
+        
+        # Extract store and commodity if not already done
+        if 'description' in transaction and transaction['description']:
+            if 'store' not in transaction or not transaction['store']:
+                store, commodity, clean_desc = self.extract_store_and_commodity(transaction['description'])
+                transaction['store'] = store
+                transaction['commodity'] = commodity
+                transaction['description'] = clean_desc
+        
+        # Normalize other text fields
+        for field in ['store', 'personName', 'upiId', 'branch']:
+            if field in transaction and transaction[field] and isinstance(transaction[field], str):
+                transaction[field] = self.normalize_text(transaction[field])
+        
+        return transaction
+    
+    def normalize_transactions_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the numeric part of normalize_transaction to a whole DataFrame.
+        
+        Rows are expected to have gone through normalize_transaction_text.
+        
+        Args:
+            df: DataFrame of transactions
+            
+        Returns:
+            Normalized DataFrame
+        """
+        if df.empty:
+            return df
+        
+        # Ensure numeric fields - use strict amount parsing
+        for field in ['amount', 'debit', 'credit', 'balance']:
+            if field in df.columns and not pd.api.types.is_float_dtype(df[field]):
+                df[field] = df[field].map(self._coerce_amount, na_action='ignore')
+        
+        zero_value = pd.Series(0.0, index=df.index)
+        debit = df['debit'].fillna(0.0) if 'debit' in df.columns else zero_value
+        credit = df['credit'].fillna(0.0) if 'credit' in df.columns else zero_value
+        zero_amount = (debit == 0) & (credit == 0)
+        
+        # Set bank code
+        df['bankCode'] = self.bank_code
+        
+        # If only amount is provided, infer credit/debit
+        if 'amount' in df.columns:
+            amount = df['amount'].abs().fillna(0.0)
+            income = df['type'].eq('income') if 'type' in df.columns else pd.Series(False, index=df.index)
+            debit = debit.mask(zero_amount & ~income, amount)
+            credit = credit.mask(zero_amount & income, amount)
+        
+        # Ensure both fields exist and are non-negative
+        df['debit'] = debit.where(debit > 0, 0.0).astype('float64')
+        df['credit'] = credit.where(credit > 0, 0.0).astype('float64')
+        
+        # Flag zero amounts both before and after normalization
+        zero_amount |= (df['debit'] == 0) & (df['credit'] == 0)
+        if zero_amount.any():
+            if 'hasZeroAmount' in df.columns:
+                df.loc[zero_amount, 'hasZeroAmount'] = True
+            else:
+                df['hasZeroAmount'] = pd.Series(True, index=df.index, dtype=object).where(zero_amount)
+        
+        # Remove legacy 'type' field if present (we use credit/debit now)
+        return df.drop(columns='type', errors='ignore')
+    
+    def _coerce_amount(self, value) -> float:
+        """Coerce a raw amount field to float using strict amount parsing."""
+        if isinstance(value, str):
+            return self.parse_amount(value)
+        if isinstance(value, (int, float)):
+            return float(value)
+        # Try to convert to string and parse
+        return self.parse_amount(str(value))
+    
     def create_transaction_id(self, transaction: Dict) -> str:
         """
         Create unique transaction ID for deduplication.
@@ -431,6 +944,26 @@ class BaseBankParser(ABC):
         key = f"{transaction.get('date_iso', '')}_{transaction.get('description', '')}_{transaction.get('debit', 0)}_{transaction.get('credit', 0)}"
         return hashlib.md5(key.encode()).hexdigest()
     
+    def transaction_fingerprint(self, transaction: Dict) -> int:
+        """
+        Create a 64-bit integer fingerprint for in-memory deduplication.
+        
+        Hashes the same fields as create_transaction_id, but is cheaper to
+        compute and store in a seen-set than a hex digest string.
+        
+        Args:
+            transaction: Transaction dictionary
+            
+        Returns:
+            64-bit integer fingerprint
+        """
+        key = f"{transaction.get('date_iso', '')}_{transaction.get('description', '')}_{transaction.get('debit', 0)}_{transaction.get('credit', 0)}".encode()
+        if xxhash is not None:
+            return xxhash.xxh3_64_intdigest(key)
+        
+        import hashlib
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+    
     def extract_statement_metadata(self, pdf_path, transactions_df: Optional[pd.DataFrame] = None) -> Dict:
         """
         Extract statement metadata including opening balance, period, account info.
@@ -13,7 +13,7 @@ Key characteristics:
 import re
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import pdfplumber
 
 try:
@@ -22,6 +22,38 @@ except ImportError:
     from base_parser import BaseBankParser
 
 
+def _classify_by_balance(amount: float, balance: float, prev_balance: Optional[float]) -> Tuple[float, float]:
+    """
+    Split an unsigned amount into (withdrawal, deposit) using the balance movement.
+    
+    Args:
+        amount: Transaction amount (unsigned)
+        balance: Closing balance after this transaction
+        prev_balance: Closing balance of the previous transaction, if known
+        
+    Returns:
+        Tuple of (withdrawal, deposit); exactly one of them carries the amount
+    """
+    if prev_balance is not None:
+        if balance < prev_balance:
+            # Balance decreased, it's a withdrawal
+            return amount, 0
+        if balance > prev_balance:
+            # Balance increased, it's a deposit
+            return 0, amount
+        # Balance unchanged (unusual), try to infer from amount size
+        # Large amounts are typically deposits, small are withdrawals
+        if amount > balance * 0.5:
+            return 0, amount
+        return amount, 0
+    
+    # First transaction on page, can't compare
+    # Infer from amount size
+    if amount > 1000:  # Large amount likely deposit
+        return 0, amount
+    return amount, 0
+
+
 class HDFCBankParser(BaseBankParser):
     """Parser for HDFC Bank statements."""
     
@@ -140,30 +172,7 @@ class HDFCBankParser(BaseBankParser):
                 balance = self.parse_amount(balance_str)
                 
                 # Determine if it's withdrawal or deposit by comparing with previous balance
-                withdrawal = 0
-                deposit = 0
-                
-                if prev_balance is not None:
-                    if balance < prev_balance:
-                        # Balance decreased, it's a withdrawal
-                        withdrawal = amount
-                    elif balance > prev_balance:
-                        # Balance increased, it's a deposit
-                        deposit = amount
-                    else:
-                        # Balance unchanged (unusual), try to infer from amount size
-                        # Large amounts are typically deposits, small are withdrawals
-                        if amount > balance * 0.5:
-                            deposit = amount
-                        else:
-                            withdrawal = amount
-                else:
-                    # First transaction on page, can't compare
-                    # Infer from amount size or skip
-                    if amount > 1000:  # Large amount likely deposit
-                        deposit = amount
-                    else:
-                        withdrawal = amount
+                withdrawal, deposit = _classify_by_balance(amount, balance, prev_balance)
                 
                 # Skip if no valid transaction
                 if withdrawal == 0 and deposit == 0:
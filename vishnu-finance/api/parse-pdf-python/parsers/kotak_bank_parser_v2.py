@@ -5,16 +5,69 @@ Parser for Kotak Bank statements with separate DEBIT/CREDIT columns format.
 Format: Date | Transaction Details | Cheque/Reference# | Debit | Credit | Balance
 """
 
+import logging
 import re
+from datetime import date
+from functools import lru_cache
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import pdfplumber
 
 try:
-    from .base_parser import BaseBankParser
+    from .base_parser import BaseBankParser, TransactionColumns, cell_str, line_label, page_label
 except ImportError:
-    from base_parser import BaseBankParser
+    from base_parser import BaseBankParser, TransactionColumns, cell_str, line_label, page_label
+
+logger = logging.getLogger(__name__)
+
+
+# Kotak Type 2 date: "DD MMM, YYYY" (e.g. "01 Sep, 2025")
+_DATE_RE = re.compile(r'(\d{1,2}\s+[A-Za-z]{3,},\s*\d{4})')
+# First "-amount" (debit) or, only if there is none, first "+amount" (credit)
+_SIGNED_AMOUNT_RE = re.compile(
+    r'^(?:.*?-(?P<debit>[0-9,]+\.?\d{0,2})|.*?\+(?P<credit>[0-9,]+\.?\d{0,2}))'
+)
+_BALANCE_TAIL_RE = re.compile(r'\b([0-9,]+\.?\d{2})\s*(?:C|D)?$')
+# Date, signed amounts and UPI ref numbers, stripped from text-fallback lines in one pass
+_SCRUB_RE = re.compile(r'\d{1,2}\s+[A-Za-z]{3,},\s*\d{4}|UPI-\d+|[-+][0-9,]+\.?\d{0,2}')
+_WS_RE = re.compile(r'\s+')
+
+# First-cell values of header, separator and summary rows
+_JUNK_DATE = frozenset({'date', 'none', 'nan', '', 'closing', 'opening', 'balance'})
+
+# Narration metadata patterns
+_UPI_SLASH_RE = re.compile(r'UPI/([^/]+)/([0-9]+)/([^/\n]+)', re.IGNORECASE)
+_UPI_DASH_RE = re.compile(r'UPI-([0-9]+)', re.IGNORECASE)
+_MB_RE = re.compile(r'MB[:\s]+([^/\n]+)', re.IGNORECASE)
+_XFER_RE = re.compile(r'(NEFT|RTGS|IMPS)[^\d]*(\d+)', re.IGNORECASE)
+
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+
+@lru_cache(maxsize=4096)
+def _fast_kotak_date(date_str: str) -> Optional[str]:
+    """
+    Parse "DD MMM, YYYY" / "DD MMM YYYY" without going through pandas.
+    
+    Returns:
+        ISO date string, or None if the string is not in that shape
+    """
+    parts = date_str.replace(',', ' ').split()
+    if len(parts) != 3:
+        return None
+    
+    day, month, year = parts
+    month_num = _MONTHS.get(month.lower())
+    if not month_num or len(year) != 4:
+        return None
+    
+    try:
+        return date(int(year), month_num, int(day)).isoformat()
+    except ValueError:
+        return None
 
 
 class KotakBankParserV2(BaseBankParser):
@@ -34,51 +87,55 @@ class KotakBankParserV2(BaseBankParser):
         Returns:
             DataFrame of transactions
         """
-        transactions = []
+        transactions = TransactionColumns()
         seen_transactions = set()
         
         try:
-            with pdfplumber.open(str(pdf_path)) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    # Try table extraction first
-                    tables = page.extract_tables()
-                    
-                    if tables:
-                        # Process each table
-                        for table in tables:
-                            if len(table) < 2:  # Need at least header + 1 data row
-                                continue
-                            
-                            # Look for transaction rows
-                            for row_idx, row in enumerate(table):
-                                if not row or len(row) < 6:
-                                    continue
-                                
-                                transaction = self._parse_table_row(row, page_num + 1, row_idx)
-                                if transaction:
-                                    # Deduplicate
-                                    txn_id = self.create_transaction_id(transaction)
-                                    if txn_id not in seen_transactions:
-                                        seen_transactions.add(txn_id)
-                                        transactions.append(transaction)
-                    else:
-                        # Fallback to text extraction if tables not found
-                        text = page.extract_text()
-                        if text:
-                            rows = self._parse_text_lines(text)
-                            for transaction in rows:
-                                if transaction:
-                                    txn_id = self.create_transaction_id(transaction)
-                                    if txn_id not in seen_transactions:
-                                        seen_transactions.add(txn_id)
-                                        transactions.append(transaction)
+            for transaction in self.iter_parsed_pdf_pages(pdf_path):
+                # Deduplicate
+                txn_id = self.transaction_fingerprint(transaction)
+                if txn_id not in seen_transactions:
+                    seen_transactions.add(txn_id)
+                    transactions.append(transaction)
         
-        except Exception as e:
-            print(f"Error parsing Kotak Bank V2 PDF: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error parsing Kotak Bank V2 PDF")
         
-        return pd.DataFrame(transactions) if transactions else pd.DataFrame()
+        return transactions.to_dataframe()
+    
+    def _parse_page(self, page_num: int, tables: List, get_text, seen_rows: set) -> List[Dict]:
+        """Parse one page's tables, falling back to its text if no tables were found."""
+        transactions = []
+        
+        # Try table extraction first
+        if tables:
+            # Process each table
+            for table in tables:
+                if len(table) < 2:  # Need at least header + 1 data row
+                    continue
+                
+                # Look for transaction rows
+                for row_idx, row in enumerate(table):
+                    if not row or len(row) < 6:
+                        continue
+                    
+                    # Skip repeated rows (overlapping tables) before the expensive parse;
+                    # an identical row would yield the same transaction ID anyway
+                    row_key = (row[0], row[1], row[3], row[4], row[5])
+                    if row_key in seen_rows:
+                        continue
+                    seen_rows.add(row_key)
+                    
+                    transaction = self._parse_table_row(row, page_num, row_idx)
+                    if transaction:
+                        transactions.append(transaction)
+        else:
+            # Fallback to text extraction if tables not found
+            text = get_text()
+            if text:
+                transactions.extend(t for t in self._parse_text_lines(text) if t)
+        
+        return transactions
     
     def parse_excel(self, file_path: Path) -> pd.DataFrame:
         """
@@ -101,15 +158,13 @@ class KotakBankParserV2(BaseBankParser):
             for idx, row in df.iterrows():
                 transaction = self._parse_excel_row(row, idx)
                 if transaction:
-                    txn_id = self.create_transaction_id(transaction)
+                    txn_id = self.transaction_fingerprint(transaction)
                     if txn_id not in seen_transactions:
                         seen_transactions.add(txn_id)
                         transactions.append(transaction)
         
-        except Exception as e:
-            print(f"Error parsing Kotak Bank V2 Excel: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error parsing Kotak Bank V2 Excel")
         
         return pd.DataFrame(transactions) if transactions else pd.DataFrame()
     
@@ -125,45 +180,45 @@ class KotakBankParserV2(BaseBankParser):
         - Column 4: CREDIT
         - Column 5: BALANCE
         """
-        if not row or len(row) < 3:
+        # Rows with fewer than 5 columns carry no amounts
+        if not row or len(row) < 5:
             return None
         
+        # Reject header/separator rows before any other work
+        first_cell = cell_str(row[0])
+        if first_cell is None or first_cell.lower() in _JUNK_DATE:
+            return None
+        
+        if len(row) >= 6:
+            return self._parse_table_row_6col(row, page, line)
+        return self._parse_table_row_5col(row, page, line)
+    
+    def _parse_table_row_6col(self, row: List, page: int, line: int) -> Optional[Dict]:
+        """Parse a full-width row: DATE | DETAILS | REF | DEBIT | CREDIT | BALANCE."""
+        date_cell, narration_cell, ref_cell, debit_cell, credit_cell, balance_cell = row[:6]
+        return self._build_row_transaction(
+            cell_str(date_cell), cell_str(narration_cell), cell_str(ref_cell),
+            cell_str(debit_cell), cell_str(credit_cell), cell_str(balance_cell),
+            page, line
+        )
+    
+    def _parse_table_row_5col(self, row: List, page: int, line: int) -> Optional[Dict]:
+        """Parse a row missing the BALANCE column."""
+        date_cell, narration_cell, ref_cell, debit_cell, credit_cell = row[:5]
+        return self._build_row_transaction(
+            cell_str(date_cell), cell_str(narration_cell), cell_str(ref_cell),
+            cell_str(debit_cell), cell_str(credit_cell), None,
+            page, line
+        )
+    
+    def _build_row_transaction(self, date_str: Optional[str], narration: Optional[str],
+                               ref_no: Optional[str], debit_str: Optional[str],
+                               credit_str: Optional[str], balance_str: Optional[str],
+                               page: int, line: int) -> Optional[Dict]:
+        """Build a transaction dictionary from the stripped cells of a table row."""
         try:
-            # Find columns by content or position
-            date_str = None
-            narration = None
-            ref_no = None
-            debit_str = None
-            credit_str = None
-            balance_str = None
-            
-            # Look for date in first column
-            if row[0] and str(row[0]).strip():
-                cell_str = str(row[0]).strip()
-                # Check if this looks like a date (DD MMM, YYYY format for Kotak Type 2)
-                if re.match(r'\d{1,2}\s+[A-Za-z]{3,},\s*\d{4}', cell_str):
-                    date_str = cell_str
-            
-            # Use position-based parsing if we have enough columns
-            if len(row) >= 6:
-                if not date_str:
-                    date_str = str(row[0]).strip() if row[0] else None
-                narration = str(row[1]).strip() if row[1] else None
-                ref_no = str(row[2]).strip() if row[2] else None
-                debit_str = str(row[3]).strip() if row[3] else None
-                credit_str = str(row[4]).strip() if row[4] else None
-                balance_str = str(row[5]).strip() if row[5] else None
-            elif len(row) >= 5:
-                # Some rows might have missing columns
-                if not date_str:
-                    date_str = str(row[0]).strip() if row[0] else None
-                narration = str(row[1]).strip() if row[1] else None
-                ref_no = str(row[2]).strip() if row[2] else None
-                debit_str = str(row[3]).strip() if row[3] else None
-                credit_str = str(row[4]).strip() if row[4] else None
-            
             # Skip if no date
-            if not date_str or date_str.lower() in ['date', 'none', 'nan', '', 'closing']:
+            if not date_str or date_str.lower() in _JUNK_DATE:
                 return None
             
             # Skip header rows
@@ -220,8 +275,8 @@ class KotakBankParserV2(BaseBankParser):
                 'debit': debit,
                 'credit': credit,
                 'balance': balance,
-                'page': f'Page {page}',
-                'line': str(line),
+                'page': page_label(page),
+                'line': line_label(line),
                 'store': store,
                 'commodity': commodity,
                 'reference': ref_no,
@@ -231,7 +286,7 @@ class KotakBankParserV2(BaseBankParser):
             return self.normalize_transaction(transaction)
         
         except Exception as e:
-            print(f"Error parsing table row: {e}")
+            logger.warning("Error parsing table row: %s", e)
             return None
     
     def _parse_excel_row(self, row: pd.Series, idx: int) -> Optional[Dict]:
@@ -294,7 +349,7 @@ class KotakBankParserV2(BaseBankParser):
                 'credit': credit,
                 'balance': balance,
                 'page': 'Excel',
-                'line': str(idx + 1),
+                'line': line_label(idx + 1),
                 'store': store,
                 'commodity': commodity,
                 'reference': ref_no,
@@ -304,55 +359,52 @@ class KotakBankParserV2(BaseBankParser):
             return self.normalize_transaction(transaction)
         
         except Exception as e:
-            print(f"Error parsing Excel row: {e}")
+            logger.warning("Error parsing Excel row: %s", e)
             return None
     
     def _parse_text_lines(self, text: str) -> List[Dict]:
         """Parse text lines as fallback when tables not detected."""
         transactions = []
-        lines = text.split('\n')
         
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Look for transaction lines with dates (DD MMM, YYYY format)
-            date_match = re.search(r'(\d{1,2}\s+[A-Za-z]{3,},\s*\d{4})', line)
-            if not date_match:
-                continue
-            
-            date_str = date_match.group(1)
+        # Run the per-line regexes as vectorized pandas string ops, then only
+        # loop in Python over lines that carry a date
+        lines = pd.Series(text.split('\n'), dtype=object).str.strip()
+        dates = lines.str.extract(_DATE_RE, expand=False)
+        candidates = lines[dates.notna()]
+        if candidates.empty:
+            return transactions
+        
+        amounts = candidates.str.extract(_SIGNED_AMOUNT_RE)
+        balances = candidates.str.extract(_BALANCE_TAIL_RE, expand=False)
+        # Description: remove date, amounts, and ref numbers
+        descriptions = (
+            candidates.str.replace(_SCRUB_RE, '', regex=True)
+            .str.replace(_WS_RE, ' ', regex=True)
+            .str.strip()
+        )
+        
+        for line_num, date_str, debit_str, credit_str, balance_str, description in zip(
+            candidates.index, dates[candidates.index], amounts['debit'], amounts['credit'], balances, descriptions
+        ):
             date_iso = self._parse_kotak_date_v2(date_str)
             if not date_iso:
                 continue
             
             # Extract debit and credit amounts
-            debit_match = re.search(r'-([0-9,]+\.?\d{0,2})', line)
-            credit_match = re.search(r'\+([0-9,]+\.?\d{0,2})', line)
-            
             debit = 0.0
             credit = 0.0
             
-            if debit_match:
-                debit = float(debit_match.group(1).replace(',', ''))
-            elif credit_match:
-                credit = float(credit_match.group(1).replace(',', ''))
+            if isinstance(debit_str, str):
+                debit = float(debit_str.replace(',', ''))
+            elif isinstance(credit_str, str):
+                credit = float(credit_str.replace(',', ''))
             else:
                 continue
             
             # Extract balance
-            balance_match = re.search(r'\b([0-9,]+\.?\d{2})\s*(?:C|D)?$', line)
             balance = None
-            if balance_match:
-                balance = float(balance_match.group(1).replace(',', ''))
-            
-            # Extract description (remove date, amounts, and ref numbers)
-            description = line
-            description = re.sub(r'\d{1,2}\s+[A-Za-z]{3,},\s*\d{4}', '', description)  # Remove date
-            description = re.sub(r'[-+]([0-9,]+\.?\d{0,2})', '', description)  # Remove amounts
-            description = re.sub(r'UPI-\d+', '', description)  # Remove UPI ref numbers
-            description = re.sub(r'\s+', ' ', description).strip()
+            if isinstance(balance_str, str):
+                balance = float(balance_str.replace(',', ''))
             
             metadata = self._extract_metadata(description)
             store, commodity, clean_desc = self.extract_store_and_commodity(description)
@@ -368,7 +420,7 @@ class KotakBankParserV2(BaseBankParser):
                 'credit': credit,
                 'balance': balance,
                 'page': 'Text',
-                'line': str(line_num + 1),
+                'line': line_label(line_num + 1),
                 'store': store,
                 'commodity': commodity,
                 **metadata
@@ -399,12 +451,12 @@ class KotakBankParserV2(BaseBankParser):
         if not details:
             return metadata
         
+        # Patterns are case-insensitive; check for their literal keywords on
+        # the upper-cased text before running each regex
+        details_upper = details.upper()
+        
         # Pattern 1: UPI transactions - UPI/[Entity]/[TxnID]/[Name]/...
-        upi_match = re.search(
-            r'UPI/([^/]+)/([0-9]+)/([^/\n]+)',
-            details,
-            re.IGNORECASE
-        )
+        upi_match = 'UPI/' in details_upper and _UPI_SLASH_RE.search(details)
         if upi_match:
             metadata['transferType'] = 'UPI'
             metadata['personName'] = upi_match.group(3).strip()
@@ -413,30 +465,21 @@ class KotakBankParserV2(BaseBankParser):
             return metadata
         
         # Pattern 2: UPI with reference number in format UPI-XXXXXXXX
-        upi_ref_match = re.search(
-            r'UPI-([0-9]+)',
-            details,
-            re.IGNORECASE
-        )
+        upi_ref_match = 'UPI-' in details_upper and _UPI_DASH_RE.search(details)
         if upi_ref_match:
             metadata['transferType'] = 'UPI'
             metadata['transactionId'] = upi_ref_match.group(1).strip()
         
         # Pattern 3: MB (Mobile Banking) transactions
-        mb_match = re.search(
-            r'MB[:\s]+([^/\n]+)',
-            details,
-            re.IGNORECASE
-        )
+        mb_match = 'MB' in details_upper and _MB_RE.search(details)
         if mb_match:
             metadata['transferType'] = 'MB'
             metadata['personName'] = mb_match.group(1).strip()
         
         # Pattern 4: NEFT/RTGS/IMPS patterns
-        transfer_match = re.search(
-            r'(NEFT|RTGS|IMPS)[^\d]*(\d+)',
-            details,
-            re.IGNORECASE
+        transfer_match = (
+            ('NEFT' in details_upper or 'RTGS' in details_upper or 'IMPS' in details_upper)
+            and _XFER_RE.search(details)
         )
         if transfer_match:
             metadata['transferType'] = transfer_match.group(1).upper()
@@ -454,6 +497,12 @@ class KotakBankParserV2(BaseBankParser):
         Returns:
             ISO formatted date string (YYYY-MM-DD) or None
         """
+        if isinstance(date_str, str):
+            # Fast path for the common "DD MMM, YYYY" shape
+            fast = _fast_kotak_date(date_str)
+            if fast:
+                return fast
+        
         if not date_str or pd.isna(date_str):
             return None
         
@@ -4,16 +4,46 @@ SBI (State Bank of India) Parser
 Parser for SBI bank statements with table extraction and pattern recognition.
 """
 
+import logging
 import re
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import pdfplumber
 
 try:
-    from .base_parser import BaseBankParser
+    from .base_parser import BaseBankParser, TransactionColumns, cell_str, line_label, page_label
 except ImportError:
-    from base_parser import BaseBankParser
+    from base_parser import BaseBankParser, TransactionColumns, cell_str, line_label, page_label
+
+logger = logging.getLogger(__name__)
+
+
+# Text-fallback patterns
+_DATE_RE = re.compile(r'(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})')
+# "INR amount - INR balance" (debit) or, only if there is none,
+# "- INR amount INR balance" (credit), in a single extract pass
+_AMOUNT_RE = re.compile(
+    r'^(?:.*?INR\s*(?P<debit>[0-9,]+(?:\.[0-9]{2})?)\s*-\s*INR\s*(?P<debit_balance>[0-9,]+(?:\.[0-9]{2})?)'
+    r'|.*?-\s*INR\s*(?P<credit>[0-9,]+(?:\.[0-9]{2})?)\s*INR\s*(?P<credit_balance>[0-9,]+(?:\.[0-9]{2})?))'
+)
+# Date, INR amounts and +/- signs, stripped from text-fallback lines in one pass
+_SCRUB_RE = re.compile(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{4}|INR\s*[0-9,]+(?:\.[0-9]{2})?|[+-]')
+_MULTI_WS_RE = re.compile(r'\s{2,}')
+
+# First-cell values of header, separator and summary rows
+_JUNK_DATE = frozenset({'date', 'none', 'nan', '', 'closing', 'opening', 'balance'})
+
+# Narration metadata patterns
+_UPI_CR_RE = re.compile(
+    r'TRANSFER FROM\s+([\w\s]+?)\s*-\s*UPI/CR/([A-Z0-9]+)/([^/]+?)/SBIN/([^/]+?)/UPI',
+    re.IGNORECASE
+)
+_UPI_DR_RE = re.compile(
+    r'TRANSFER TO\s+([\w\s]+?)\s*\.\s*UPI/DR/([A-Z0-9]+)/([^/]+?)/SBIN/([^/]+?)/Payme',
+    re.IGNORECASE
+)
+_ATM_CASH_RE = re.compile(r'ATM CASH\s+([A-Z0-9]+)\s+\+?\s*SBI\s+([^,]+),\s*([^,]+)', re.IGNORECASE)
+_GENERIC_UPI_RE = re.compile(r'UPI/([A-Z]+)/([A-Z0-9]+)/([^/]+?)/(SBIN|SBI)/([^/\s]+)', re.IGNORECASE)
 
 
 class SBIParser(BaseBankParser):
@@ -33,51 +63,55 @@ class SBIParser(BaseBankParser):
         Returns:
             DataFrame of transactions
         """
-        transactions = []
+        transactions = TransactionColumns()
         seen_transactions = set()
         
         try:
-            with pdfplumber.open(str(pdf_path)) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    # Try table extraction first
-                    tables = page.extract_tables()
-                    
-                    if tables:
-                        # Process each table
-                        for table in tables:
-                            if len(table) < 2:  # Need at least header + 1 data row
-                                continue
-                            
-                            # Look for transaction rows (date in first column)
-                            for row_idx, row in enumerate(table):
-                                if not row or len(row) < 6:
-                                    continue
-                                
-                                transaction = self._parse_table_row(row, page_num + 1, row_idx)
-                                if transaction:
-                                    # Deduplicate
-                                    txn_id = self.create_transaction_id(transaction)
-                                    if txn_id not in seen_transactions:
-                                        seen_transactions.add(txn_id)
-                                        transactions.append(transaction)
-                    else:
-                        # Fallback to text extraction if tables not found
-                        text = page.extract_text()
-                        if text:
-                            rows = self._parse_text_lines(text)
-                            for transaction in rows:
-                                if transaction:
-                                    txn_id = self.create_transaction_id(transaction)
-                                    if txn_id not in seen_transactions:
-                                        seen_transactions.add(txn_id)
-                                        transactions.append(transaction)
+            for transaction in self.iter_parsed_pdf_pages(pdf_path):
+                # Deduplicate
+                txn_id = self.transaction_fingerprint(transaction)
+                if txn_id not in seen_transactions:
+                    seen_transactions.add(txn_id)
+                    transactions.append(transaction)
         
-        except Exception as e:
-            print(f"Error parsing SBI PDF: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error parsing SBI PDF")
         
-        return pd.DataFrame(transactions) if transactions else pd.DataFrame()
+        return transactions.to_dataframe()
+    
+    def _parse_page(self, page_num: int, tables: List, get_text, seen_rows: set) -> List[Dict]:
+        """Parse one page's tables, falling back to its text if no tables were found."""
+        transactions = []
+        
+        # Try table extraction first
+        if tables:
+            # Process each table
+            for table in tables:
+                if len(table) < 2:  # Need at least header + 1 data row
+                    continue
+                
+                # Look for transaction rows (date in first column)
+                for row_idx, row in enumerate(table):
+                    if not row or len(row) < 6:
+                        continue
+                    
+                    # Skip repeated rows (overlapping tables) before the expensive parse;
+                    # an identical row would yield the same transaction ID anyway
+                    row_key = (row[0], row[1], row[3], row[4], row[5])
+                    if row_key in seen_rows:
+                        continue
+                    seen_rows.add(row_key)
+                    
+                    transaction = self._parse_table_row(row, page_num, row_idx)
+                    if transaction:
+                        transactions.append(transaction)
+        else:
+            # Fallback to text extraction if tables not found
+            text = get_text()
+            if text:
+                transactions.extend(t for t in self._parse_text_lines(text) if t)
+        
+        return transactions
     
     def parse_excel(self, file_path: Path) -> pd.DataFrame:
         """
@@ -100,15 +134,13 @@ class SBIParser(BaseBankParser):
             for idx, row in df.iterrows():
                 transaction = self._parse_excel_row(row, idx)
                 if transaction:
-                    txn_id = self.create_transaction_id(transaction)
+                    txn_id = self.transaction_fingerprint(transaction)
                     if txn_id not in seen_transactions:
                         seen_transactions.add(txn_id)
                         transactions.append(transaction)
         
-        except Exception as e:
-            print(f"Error parsing SBI Excel: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error parsing SBI Excel")
         
         return pd.DataFrame(transactions) if transactions else pd.DataFrame()
     
@@ -117,18 +149,18 @@ class SBIParser(BaseBankParser):
         if not row or len(row) < 6:
             return None
         
+        # Reject header/separator rows before any other work
+        date_str = cell_str(row[0])
+        if date_str is None or date_str.lower() in _JUNK_DATE:
+            return None
+        
         try:
             # Columns: Date | Details | Ref No. | Debit | Credit | Balance
-            date_str = str(row[0]).strip() if row[0] else None
-            details = str(row[1]).strip() if row[1] else None
-            ref_no = str(row[2]).strip() if row[2] else None
-            debit_str = str(row[3]).strip() if row[3] else None
-            credit_str = str(row[4]).strip() if row[4] else None
-            balance_str = str(row[5]).strip() if row[5] else None
-            
-            # Skip if no date
-            if not date_str or date_str.lower() in ['date', 'none', 'nan', '']:
-                return None
+            details = cell_str(row[1])
+            ref_no = cell_str(row[2])
+            debit_str = cell_str(row[3])
+            credit_str = cell_str(row[4])
+            balance_str = cell_str(row[5])
             
             # Parse date
             date_iso = self.parse_date(date_str)
@@ -168,8 +200,8 @@ class SBIParser(BaseBankParser):
                 'debit': debit,
                 'credit': credit,
                 'balance': balance,
-                'page': f'Page {page}',
-                'line': str(line),
+                'page': page_label(page),
+                'line': line_label(line),
                 'store': store,
                 'commodity': commodity,
                 **metadata
@@ -178,7 +210,7 @@ class SBIParser(BaseBankParser):
             return self.normalize_transaction(transaction)
         
         except Exception as e:
-            print(f"Error parsing table row: {e}")
+            logger.warning("Error parsing table row: %s", e)
             return None
     
     def _parse_excel_row(self, row: pd.Series, idx: int) -> Optional[Dict]:
@@ -229,7 +261,7 @@ class SBIParser(BaseBankParser):
                 'credit': credit,
                 'balance': balance,
                 'page': 'Excel',
-                'line': str(idx + 1),
+                'line': line_label(idx + 1),
                 'store': store,
                 'commodity': commodity,
                 **metadata
@@ -238,61 +270,47 @@ class SBIParser(BaseBankParser):
             return self.normalize_transaction(transaction)
         
         except Exception as e:
-            print(f"Error parsing Excel row: {e}")
+            logger.warning("Error parsing Excel row: %s", e)
             return None
     
     def _parse_text_lines(self, text: str) -> List[Dict]:
         """Parse text lines as fallback when tables not detected."""
         transactions = []
-        lines = text.split('\n')
         
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Look for transaction lines with dates
-            date_match = re.search(r'(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})', line)
-            if not date_match:
-                continue
-            
-            date = date_match.group(1)
+        # Run the per-line regexes as vectorized pandas string ops, then only
+        # loop in Python over lines that carry a date
+        lines = pd.Series(text.split('\n'), dtype=object).str.strip()
+        dates = lines.str.extract(_DATE_RE, expand=False)
+        candidates = lines[dates.notna()]
+        if candidates.empty:
+            return transactions
+        
+        amounts = candidates.str.extract(_AMOUNT_RE)
+        descriptions = (
+            candidates.str.replace(_SCRUB_RE, '', regex=True)
+            .str.replace(_MULTI_WS_RE, ' ', regex=True)
+            .str.strip()
+        )
+        
+        for line_num, date, debit_amount, debit_balance, credit_amount, credit_balance, description in zip(
+            candidates.index, dates[candidates.index],
+            amounts['debit'], amounts['debit_balance'], amounts['credit'], amounts['credit_balance'],
+            descriptions
+        ):
             date_iso = self.parse_date(date)
             if not date_iso:
                 continue
             
-            # Extract amounts
-            amount_patterns = [
-                r'INR\s*([0-9,]+(?:\.[0-9]{2})?)\s*-\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)',  # Debit
-                r'-\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)\s*INR\s*([0-9,]+(?:\.[0-9]{2})?)',  # Credit
-            ]
-            
-            transaction_amount = None
-            balance = None
-            is_credit = False
-            
-            for pattern in amount_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    if pattern.startswith('INR'):
-                        transaction_amount = float(match.group(1).replace(',', ''))
-                        balance = float(match.group(2).replace(',', ''))
-                        is_credit = False
-                    else:
-                        transaction_amount = float(match.group(1).replace(',', ''))
-                        balance = float(match.group(2).replace(',', ''))
-                        is_credit = True
-                    break
-            
-            if transaction_amount is None:
+            # Extract amounts (debit pattern first, then credit)
+            if isinstance(debit_amount, str):
+                amount_str, balance_str, is_credit = debit_amount, debit_balance, False
+            elif isinstance(credit_amount, str):
+                amount_str, balance_str, is_credit = credit_amount, credit_balance, True
+            else:
                 continue
             
-            # Extract description
-            description = line
-            description = re.sub(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{4}', '', description)
-            description = re.sub(r'INR\s*[0-9,]+(?:\.[0-9]{2})?', '', description)
-            description = re.sub(r'[+-]', '', description)
-            description = re.sub(r'\s{2,}', ' ', description).strip()
+            transaction_amount = float(amount_str.replace(',', ''))
+            balance = float(balance_str.replace(',', ''))
             
             metadata = self._extract_metadata(description)
             store, commodity, clean_desc = self.extract_store_and_commodity(description)
@@ -308,7 +326,7 @@ class SBIParser(BaseBankParser):
                 'credit': transaction_amount if is_credit else 0,
                 'balance': balance,
                 'page': 'Text',
-                'line': str(line_num + 1),
+                'line': line_label(line_num + 1),
                 'store': store,
                 'commodity': commodity,
                 **metadata
@@ -343,12 +361,13 @@ class SBIParser(BaseBankParser):
         if not details:
             return metadata
         
+        # Patterns are case-insensitive; check for their literal keywords on
+        # the upper-cased text before running each regex
+        details_upper = details.upper()
+        has_upi = 'UPI/' in details_upper
+        
         # Pattern 1: UPI Credit - TRANSFER FROM [Account] - UPI/CR/[TxnID]/[Name]/SBIN/[UPI Handle]/UPI
-        upi_credit_match = re.search(
-            r'TRANSFER FROM\s+([\w\s]+?)\s*-\s*UPI/CR/([A-Z0-9]+)/([^/]+?)/SBIN/([^/]+?)/UPI',
-            details,
-            re.IGNORECASE
-        )
+        upi_credit_match = has_upi and _UPI_CR_RE.search(details)
         if upi_credit_match:
             metadata['accountNumber'] = upi_credit_match.group(1).strip()
             metadata['transactionId'] = upi_credit_match.group(2).strip()
@@ -358,11 +377,7 @@ class SBIParser(BaseBankParser):
             return metadata
         
         # Pattern 2: UPI Debit - TRANSFER TO [Account]. UPI/DR/[TxnID]/[Name]/SBIN/[UPI Handle]/Payme
-        upi_debit_match = re.search(
-            r'TRANSFER TO\s+([\w\s]+?)\s*\.\s*UPI/DR/([A-Z0-9]+)/([^/]+?)/SBIN/([^/]+?)/Payme',
-            details,
-            re.IGNORECASE
-        )
+        upi_debit_match = has_upi and _UPI_DR_RE.search(details)
         if upi_debit_match:
             metadata['accountNumber'] = upi_debit_match.group(1).strip()
             metadata['transactionId'] = upi_debit_match.group(2).strip()
@@ -372,11 +387,7 @@ class SBIParser(BaseBankParser):
             return metadata
         
         # Pattern 3: ATM Withdrawal - - ATM CASH [ID] +SBI [Branch], [City]
-        atm_match = re.search(
-            r'ATM CASH\s+([A-Z0-9]+)\s+\+?\s*SBI\s+([^,]+),\s*([^,]+)',
-            details,
-            re.IGNORECASE
-        )
+        atm_match = 'ATM CASH' in details_upper and _ATM_CASH_RE.search(details)
         if atm_match:
             metadata['transactionId'] = atm_match.group(1).strip()
             metadata['branch'] = atm_match.group(2).strip()
@@ -384,11 +395,7 @@ class SBIParser(BaseBankParser):
             return metadata
         
         # Pattern 4: Generic UPI pattern with SBIN
-        generic_upi = re.search(
-            r'UPI/([A-Z]+)/([A-Z0-9]+)/([^/]+?)/(SBIN|SBI)/([^/\s]+)',
-            details,
-            re.IGNORECASE
-        )
+        generic_upi = has_upi and _GENERIC_UPI_RE.search(details)
         if generic_upi:
             metadata['transferType'] = f"UPI/{generic_upi.group(1)}"
             metadata['transactionId'] = generic_upi.group(2).strip()
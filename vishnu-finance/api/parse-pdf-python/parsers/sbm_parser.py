@@ -5,16 +5,56 @@ Parser for State Bank of Maharashtra bank statements with table extraction.
 Format: Sr No | Date | Particulars | Cheque/Reference No | Debit | Credit | Balance | Channel
 """
 
+import logging
 import re
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional
-import pdfplumber
+from typing import Dict, Iterator, List, Optional
 
 try:
-    from .base_parser import BaseBankParser
+    from .base_parser import BaseBankParser, TransactionColumns, cell_str
 except ImportError:
-    from base_parser import BaseBankParser
+    from base_parser import BaseBankParser, TransactionColumns, cell_str
+
+logger = logging.getLogger(__name__)
+
+
+# DD/MM/YYYY dates and amount/description patterns
+_DATE_RE = re.compile(r'(\d{2}/\d{2}/\d{4})')
+# Debit ("amount - balance") anywhere in the line wins over credit ("- amount balance")
+_AMOUNT_RE = re.compile(
+    r'^(?:.*?(?P<debit>[0-9,]+\.\d{2})\s+-\s+(?P<debit_balance>[0-9,]+\.\d{2})'
+    r'|.*?-\s+(?P<credit>[0-9,]+\.\d{2})\s+(?P<credit_balance>[0-9,]+\.\d{2}))'
+)
+# Date, amounts and +/- signs, stripped from text-fallback lines in one pass
+_SCRUB_RE = re.compile(r'\d{2}/\d{2}/\d{4}|[0-9,]+\.[0-9]{2}|[+-]')
+_WS_RE = re.compile(r'\s+')
+_MULTI_WS_RE = re.compile(r'\s{2,}')
+
+# Pages with neither a DD/MM/YYYY date nor the table header cannot yield rows
+_PAGE_HINT_RE = re.compile(r'\d{2}/\d{2}/\d{4}|particulars', re.IGNORECASE)
+
+# Date-cell values of header and empty rows
+_JUNK_DATE = frozenset({'date', 'none', 'nan', '', 'sr no'})
+
+# Particulars metadata patterns
+_UPI_RE = re.compile(r'UPI\s+([A-Z0-9]+)/([A-Z0-9]+)/([^/\n]+)', re.IGNORECASE)
+_UPI_ID_RE = re.compile(r'@([a-z0-9]+)', re.IGNORECASE)
+_NEFT_RE = re.compile(r'(NEFT|RTGS)\s+([A-Z0-9]+)', re.IGNORECASE)
+_NEFT_PAYEE_RE = re.compile(r'(?:NEFT|RTGS)[^\n]*\n([^\n]+)', re.IGNORECASE)
+_IMPS_RE = re.compile(r'IMPS\s+([A-Z0-9]+)', re.IGNORECASE)
+_ATM_RE = re.compile(r'ATM\s+(?:CASH|WITHDRAWAL|DEPOSIT)', re.IGNORECASE)
+
+
+def _is_header_row(row: List) -> bool:
+    """Check whether a table row is the SBM transaction header."""
+    # 'particulars' has no spaces, so it can only match inside a single cell;
+    # most non-header rows are rejected here before the row is joined
+    if not any(cell and 'particulars' in str(cell).lower() for cell in row):
+        return False
+    # 'sr no' may be split across cells, so test the joined row (lowercased once)
+    row_text = ' '.join([str(cell).strip() if cell else '' for cell in row]).lower()
+    return 'sr no' in row_text and 'date' in row_text and 'particulars' in row_text
 
 
 class SBMParser(BaseBankParser):
@@ -34,82 +74,83 @@ class SBMParser(BaseBankParser):
         Returns:
             DataFrame of transactions
         """
-        transactions = []
+        transactions = TransactionColumns()
         seen_transactions = set()
+        # Bound once for the per-row loops below
+        parse_row = self._parse_table_row
+        transaction_fingerprint = self.transaction_fingerprint
+        seen_add = seen_transactions.add
+        append_transaction = transactions.append
         
         try:
-            with pdfplumber.open(str(pdf_path)) as pdf:
-                header_found = False
-                previous_date_iso = None  # Track previous date for chronological validation
-                
-                for page_num, page in enumerate(pdf.pages):
-                    # Extract tables from page
-                    tables = page.extract_tables()
+            header_found = False
+            previous_date_iso = None  # Track previous date for chronological validation
+            
+            # Pages are extracted up front (in parallel for large PDFs), skipping
+            # table extraction on pages without dates or headers; rows are then
+            # processed in page order since header detection and the
+            # chronological date check carry across pages
+            for page_num, tables, get_text in self.iter_pdf_pages(pdf_path, page_hint=_PAGE_HINT_RE):
+                if tables:
+                    # Find transaction table
+                    transaction_table = None
+                    start_idx = 0  # Row index to start processing from
                     
-                    if tables:
-                        # Find transaction table
-                        transaction_table = None
-                        start_idx = 0  # Row index to start processing from
-                        
-                        for table in tables:
-                            if table and len(table) > 0:
-                                # Check if first row contains transaction headers
-                                first_row = [str(cell).strip().lower() if cell else '' for cell in table[0]]
-                                first_row_text = ' '.join(first_row)
+                    for table in tables:
+                        if table and len(table) > 0:
+                            if header_found:
+                                # Header was found on a previous page; most later tables are
+                                # continuations, so try the cheap transaction-row check first
+                                # (numeric sr_no and date) before scanning for a repeated header
+                                first_cell = str(table[0][0]).strip() if table[0] and table[0][0] else ''
+                                second_cell = str(table[0][1]).strip() if table[0] and len(table[0]) > 1 and table[0][1] else ''
                                 
-                                if 'sr no' in first_row_text and 'date' in first_row_text and 'particulars' in first_row_text:
-                                    # This is the header row - skip it when processing
+                                # Check if first cell is numeric (sr_no) and second is date-like
+                                if first_cell.isdigit() and _DATE_RE.match(second_cell):
                                     transaction_table = table
-                                    header_found = True
-                                    start_idx = 1
+                                    start_idx = 0  # No header row, start from first row
                                     break
-                                elif header_found:
-                                    # Header was found on a previous page, this is continuation
-                                    # Check if first row looks like a transaction (numeric sr_no and date)
-                                    first_cell = str(table[0][0]).strip() if table[0] and table[0][0] else ''
-                                    second_cell = str(table[0][1]).strip() if table[0] and len(table[0]) > 1 and table[0][1] else ''
-                                    
-                                    # Check if first cell is numeric (sr_no) and second is date-like
-                                    if first_cell.isdigit() and re.match(r'\d{2}/\d{2}/\d{4}', second_cell):
-                                        transaction_table = table
-                                        start_idx = 0  # No header row, start from first row
-                                        break
-                        
-                        if transaction_table:
-                            # Process transaction rows (skip header row if present)
-                            for row_idx, row in enumerate(transaction_table[start_idx:], start=start_idx + 1):
-                                if not row or len(row) < 6:
-                                    continue
+                            
+                            # Check if first row contains transaction headers
+                            if _is_header_row(table[0]):
+                                # This is the header row - skip it when processing
+                                transaction_table = table
+                                header_found = True
+                                start_idx = 1
+                                break
+                    
+                    if transaction_table:
+                        # Process transaction rows (skip header row if present)
+                        for row_idx, row in enumerate(transaction_table[start_idx:], start=start_idx + 1):
+                            if not row or len(row) < 6:
+                                continue
+                            
+                            transaction = parse_row(row, page_num, row_idx, previous_date_iso)
+                            if transaction:
+                                # Update previous date for next transaction
+                                if transaction.get('date_iso'):
+                                    previous_date_iso = transaction['date_iso']
                                 
-                                transaction = self._parse_table_row(row, page_num + 1, row_idx, previous_date_iso)
-                                if transaction:
-                                    # Update previous date for next transaction
-                                    if transaction.get('date_iso'):
-                                        previous_date_iso = transaction['date_iso']
-                                    
-                                    # Deduplicate
-                                    txn_id = self.create_transaction_id(transaction)
-                                    if txn_id not in seen_transactions:
-                                        seen_transactions.add(txn_id)
-                                        transactions.append(transaction)
-                    else:
-                        # Fallback to text extraction if tables not found
-                        text = page.extract_text()
-                        if text:
-                            rows = self._parse_text_lines(text, page_num + 1)
-                            for transaction in rows:
-                                if transaction:
-                                    txn_id = self.create_transaction_id(transaction)
-                                    if txn_id not in seen_transactions:
-                                        seen_transactions.add(txn_id)
-                                        transactions.append(transaction)
+                                # Deduplicate
+                                txn_id = transaction_fingerprint(transaction)
+                                if txn_id not in seen_transactions:
+                                    seen_add(txn_id)
+                                    append_transaction(transaction)
+                else:
+                    # Fallback to text extraction if tables not found
+                    text = get_text()
+                    if text:
+                        for transaction in self._parse_text_lines(text, page_num):
+                            if transaction:
+                                txn_id = transaction_fingerprint(transaction)
+                                if txn_id not in seen_transactions:
+                                    seen_add(txn_id)
+                                    append_transaction(transaction)
         
-        except Exception as e:
-            print(f"Error parsing SBM PDF: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error parsing SBM PDF")
         
-        return pd.DataFrame(transactions) if transactions else pd.DataFrame()
+        return self.normalize_transactions_df(transactions.to_dataframe())
     
     def parse_excel(self, file_path: Path) -> pd.DataFrame:
         """
@@ -121,54 +162,58 @@ class SBMParser(BaseBankParser):
         Returns:
             DataFrame of transactions
         """
-        transactions = []
+        transactions = TransactionColumns()
         seen_transactions = set()
+        # Bound once for the per-row loop below
+        transaction_fingerprint = self.transaction_fingerprint
+        seen_add = seen_transactions.add
+        append_transaction = transactions.append
         
         try:
             # Read Excel file
-            df = pd.read_excel(file_path)
+            df = self.read_excel(file_path)
             
             # SBM format: Sr No | Date | Particulars | Cheque/Reference No | Debit | Credit | Balance | Channel
-            for idx, row in df.iterrows():
-                transaction = self._parse_excel_row(row, idx)
+            if len(df.columns) >= 7:
+                rows = self._iter_excel_rows(df)
+            else:
+                rows = (self._parse_excel_row(row, idx) for idx, row in df.iterrows())
+            
+            for transaction in rows:
                 if transaction:
-                    txn_id = self.create_transaction_id(transaction)
+                    txn_id = transaction_fingerprint(transaction)
                     if txn_id not in seen_transactions:
-                        seen_transactions.add(txn_id)
-                        transactions.append(transaction)
+                        seen_add(txn_id)
+                        append_transaction(transaction)
         
-        except Exception as e:
-            print(f"Error parsing SBM Excel: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error parsing SBM Excel")
         
-        return pd.DataFrame(transactions) if transactions else pd.DataFrame()
+        return transactions.to_dataframe()
     
     def _parse_table_row(self, row: List, page: int, line: int, previous_date_iso: Optional[str] = None) -> Optional[Dict]:
         """Parse a table row into a transaction dictionary."""
-        if not row or len(row) < 6:
+        # Columns up to Balance are required; Channel is optional
+        if not row or len(row) < 7:
             return None
         
         try:
             # Columns: Sr No | Date | Particulars | Cheque/Reference No | Debit | Credit | Balance | Channel
-            sr_no = str(row[0]).strip() if row[0] else None
-            date_str = str(row[1]).strip() if row[1] else None
-            particulars = str(row[2]).strip() if row[2] else None
-            ref_no = str(row[3]).strip() if row[3] else None
-            debit_str = str(row[4]).strip() if row[4] else None
-            credit_str = str(row[5]).strip() if row[5] else None
-            balance_str = str(row[6]).strip() if row[6] else None
-            channel = str(row[7]).strip() if len(row) > 7 and row[7] else None
+            sr_no, date_str, particulars, ref_no, debit_str, credit_str, balance_str, channel = (
+                [cell_str(cell) for cell in row[:8]] + [None] * (8 - len(row))
+            )
             
             # Skip if no date or if it's a header row
-            if not date_str or date_str.lower() in ['date', 'none', 'nan', '', 'sr no']:
+            if not date_str or date_str.lower() in _JUNK_DATE:
                 return None
             
-            # Skip if sr_no is not numeric (likely a header or footer)
-            try:
-                int(sr_no) if sr_no else None
-            except (ValueError, TypeError):
-                return None
+            # Skip if sr_no is not numeric (likely a header or footer); plain
+            # serial numbers pass isdecimal() without the cost of a raised error
+            if sr_no and not sr_no.isdecimal():
+                try:
+                    int(sr_no)
+                except ValueError:
+                    return None
             
             # Parse date (DD/MM/YYYY format) using strict validator with chronological check
             date_iso = self.parse_date(date_str, previous_date=previous_date_iso)
@@ -177,12 +222,15 @@ class SBMParser(BaseBankParser):
             
             # Clean particulars - handle newlines
             if particulars:
-                particulars = re.sub(r'\s+', ' ', particulars).strip()
+                particulars = _WS_RE.sub(' ', particulars).strip()
             
             # Parse amounts
-            debit = self.parse_amount(debit_str) if debit_str and debit_str != '-' else 0
-            credit = self.parse_amount(credit_str) if credit_str and credit_str != '-' else 0
-            balance = self.parse_amount(balance_str) if balance_str else None
+            parse_amount = self.parse_amount
+            # Missing amounts default to 0.0 (not 0) so dedup fingerprints
+            # match rows where the same amount was written as '0.00'
+            debit = parse_amount(debit_str) if debit_str and debit_str != '-' else 0.0
+            credit = parse_amount(credit_str) if credit_str and credit_str != '-' else 0.0
+            balance = parse_amount(balance_str) if balance_str else None
             
             # Skip if no transaction amount
             if debit == 0 and credit == 0:
@@ -221,10 +269,11 @@ class SBMParser(BaseBankParser):
                 **metadata
             }
             
-            return self.normalize_transaction(transaction)
+            # Numeric fields are normalized once over the DataFrame in parse_pdf
+            return self.normalize_transaction_text(transaction)
         
         except Exception as e:
-            print(f"Error parsing table row: {e}")
+            logger.warning("Error parsing table row: %s", e)
             return None
     
     def _parse_excel_row(self, row: pd.Series, idx: int) -> Optional[Dict]:
@@ -251,6 +300,46 @@ class SBMParser(BaseBankParser):
                 balance_val = row.get('Balance') or row.get('balance')
                 channel = row.get('Channel') or row.get('channel')
             
+            return self._build_excel_transaction(idx, sr_no, date_val, particulars, ref_no,
+                                                 debit_val, credit_val, balance_val, channel)
+        
+        except Exception as e:
+            logger.warning("Error parsing Excel row: %s", e)
+            return None
+    
+    def _iter_excel_rows(self, df: pd.DataFrame) -> Iterator[Optional[Dict]]:
+        """
+        Parse a positional SBM Excel sheet column by column, yielding transactions.
+        
+        Rows without a date or without any debit/credit value are dropped with
+        column masks up front; the remaining rows are read from plain column
+        lists instead of boxing each one into a Series.
+        """
+        columns = [df.iloc[:, position] for position in range(min(len(df.columns), 8))]
+        keep = columns[1].notna() & (columns[4].notna() | columns[5].notna())
+        values = [column[keep].astype(object).where(column[keep].notna(), None).tolist()
+                  for column in columns]
+        if len(values) < 8:
+            values.append([None] * int(keep.sum()))
+        
+        for idx, sr_no, date_val, particulars, ref_no, debit_val, credit_val, balance_val, channel in zip(
+                df.index[keep], *values):
+            yield self._build_excel_transaction(
+                idx,
+                str(sr_no) if sr_no is not None else None,
+                date_val,
+                str(particulars) if particulars is not None else None,
+                str(ref_no) if ref_no is not None else None,
+                debit_val,
+                credit_val,
+                balance_val,
+                str(channel) if channel is not None else None,
+            )
+    
+    def _build_excel_transaction(self, idx, sr_no, date_val, particulars, ref_no,
+                                 debit_val, credit_val, balance_val, channel) -> Optional[Dict]:
+        """Build a transaction dictionary from one Excel row's cell values."""
+        try:
             if not date_val:
                 return None
             
@@ -264,9 +353,10 @@ class SBMParser(BaseBankParser):
             if not date_iso:
                 return None
             
-            debit = self.parse_amount(debit_val) if debit_val and str(debit_val) != '-' else 0
-            credit = self.parse_amount(credit_val) if credit_val and str(credit_val) != '-' else 0
-            balance = self.parse_amount(balance_val) if balance_val else None
+            parse_amount = self.parse_amount
+            debit = parse_amount(debit_val) if debit_val and str(debit_val) != '-' else 0
+            credit = parse_amount(credit_val) if credit_val and str(credit_val) != '-' else 0
+            balance = parse_amount(balance_val) if balance_val else None
             
             if debit == 0 and credit == 0:
                 return None
@@ -296,65 +386,55 @@ class SBMParser(BaseBankParser):
             return self.normalize_transaction(transaction)
         
         except Exception as e:
-            print(f"Error parsing Excel row: {e}")
+            logger.warning("Error parsing Excel row: %s", e)
             return None
     
-    def _parse_text_lines(self, text: str, page_num: int) -> List[Dict]:
-        """Parse text lines as fallback when tables not detected."""
-        transactions = []
+    def _parse_text_lines(self, text: str, page_num: int) -> Iterator[Dict]:
+        """Parse text lines as fallback when tables not detected, yielding transactions."""
         lines = text.split('\n')
+        # Bound once for the per-line loop below
+        parse_date = self.parse_date
+        extract_metadata = self._extract_metadata
+        extract_store_and_commodity = self.extract_store_and_commodity
+        normalize_transaction_text = self.normalize_transaction_text
         
         # Look for transaction lines with dates in DD/MM/YYYY format
         for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line:
+            # A DD/MM/YYYY date needs a '/'; most lines fail this C-level
+            # check and are skipped before stripping or any regex work
+            if '/' not in line:
                 continue
             
+            line = line.strip()
+            
             # Look for date pattern DD/MM/YYYY
-            date_match = re.search(r'(\d{2}/\d{2}/\d{4})', line)
+            date_match = _DATE_RE.search(line)
             if not date_match:
                 continue
             
             date = date_match.group(1)
-            date_iso = self.parse_date(date)
+            date_iso = parse_date(date)
             if not date_iso:
                 continue
             
-            # Extract amounts - look for debit/credit pattern
-            amount_patterns = [
-                r'([0-9,]+\.\d{2})\s+-\s+([0-9,]+\.\d{2})',  # Debit format
-                r'-\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})',  # Credit format
-            ]
-            
-            transaction_amount = None
-            balance = None
-            is_credit = False
-            
-            for pattern in amount_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    if pattern.startswith('([0-9'):
-                        transaction_amount = float(match.group(1).replace(',', ''))
-                        balance = float(match.group(2).replace(',', ''))
-                        is_credit = False
-                    else:
-                        transaction_amount = float(match.group(1).replace(',', ''))
-                        balance = float(match.group(2).replace(',', ''))
-                        is_credit = True
-                    break
-            
-            if transaction_amount is None:
+            # Extract amounts - debit pattern first, then credit, in one match
+            match = _AMOUNT_RE.match(line)
+            if not match:
                 continue
             
+            is_credit = match.group('debit') is None
+            if is_credit:
+                transaction_amount = float(match.group('credit').replace(',', ''))
+                balance = float(match.group('credit_balance').replace(',', ''))
+            else:
+                transaction_amount = float(match.group('debit').replace(',', ''))
+                balance = float(match.group('debit_balance').replace(',', ''))
+            
             # Extract description
-            description = line
-            description = re.sub(r'\d{2}/\d{2}/\d{4}', '', description)
-            description = re.sub(r'[0-9,]+\.[0-9]{2}', '', description)
-            description = re.sub(r'[+-]', '', description)
-            description = re.sub(r'\s{2,}', ' ', description).strip()
+            description = _MULTI_WS_RE.sub(' ', _SCRUB_RE.sub('', line)).strip()
             
-            metadata = self._extract_metadata(description, None, None)
-            store, commodity, clean_desc = self.extract_store_and_commodity(description)
+            metadata = extract_metadata(description, None, None)
+            store, commodity, clean_desc = extract_store_and_commodity(description)
             
             transaction = {
                 'date': date,
@@ -363,8 +443,8 @@ class SBMParser(BaseBankParser):
                 'raw': description,
                 'amount': transaction_amount,
                 'type': 'income' if is_credit else 'expense',
-                'debit': 0 if is_credit else transaction_amount,
-                'credit': transaction_amount if is_credit else 0,
+                'debit': 0.0 if is_credit else transaction_amount,
+                'credit': transaction_amount if is_credit else 0.0,
                 'balance': balance,
                 'page': f'Page {page_num}',
                 'line': str(line_num + 1),
@@ -373,9 +453,7 @@ class SBMParser(BaseBankParser):
                 **metadata
             }
             
-            transactions.append(self.normalize_transaction(transaction))
-        
-        return transactions
+            yield normalize_transaction_text(transaction)
     
     
     def _extract_metadata(self, particulars: str, ref_no: Optional[str], channel: Optional[str]) -> Dict:
@@ -407,13 +485,13 @@ class SBMParser(BaseBankParser):
         if ref_no and ref_no.strip() and ref_no.strip() != '-':
             metadata['transactionId'] = ref_no.strip()
         
+        # Patterns are case-insensitive; check for their literal keywords on
+        # the upper-cased text before running each regex
+        particulars_upper = particulars.upper()
+        
         # Pattern 1: UPI transactions
         # Format: UPI <ref>/<bank_code>/<merchant>/...
-        upi_match = re.search(
-            r'UPI\s+([A-Z0-9]+)/([A-Z0-9]+)/([^/\n]+)',
-            particulars,
-            re.IGNORECASE
-        )
+        upi_match = 'UPI' in particulars_upper and _UPI_RE.search(particulars)
         if upi_match:
             metadata['transactionId'] = upi_match.group(1).strip()
             bank_code = upi_match.group(2).strip()
@@ -421,7 +499,7 @@ class SBMParser(BaseBankParser):
             metadata['transferType'] = 'UPI'
             
             # Extract UPI ID if present in merchant name
-            upi_id_match = re.search(r'@([a-z0-9]+)', merchant, re.IGNORECASE)
+            upi_id_match = _UPI_ID_RE.search(merchant)
             if upi_id_match:
                 metadata['upiId'] = upi_id_match.group(1).strip()
             
@@ -432,10 +510,9 @@ class SBMParser(BaseBankParser):
             return metadata
         
         # Pattern 2: NEFT/RTGS transactions
-        neft_match = re.search(
-            r'(NEFT|RTGS)\s+([A-Z0-9]+)',
-            particulars,
-            re.IGNORECASE
+        neft_match = (
+            ('NEFT' in particulars_upper or 'RTGS' in particulars_upper)
+            and _NEFT_RE.search(particulars)
         )
         if neft_match:
             txn_type = neft_match.group(1).strip().upper()
@@ -444,11 +521,7 @@ class SBMParser(BaseBankParser):
             metadata['transactionId'] = ref
             
             # Extract payee name if present
-            payee_match = re.search(
-                r'(?:NEFT|RTGS)[^\n]*\n([^\n]+)',
-                particulars,
-                re.IGNORECASE
-            )
+            payee_match = _NEFT_PAYEE_RE.search(particulars)
             if payee_match:
                 payee = payee_match.group(1).strip()
                 if payee and not payee.startswith('SBIN') and not payee.startswith('MAHB'):
@@ -457,22 +530,14 @@ class SBMParser(BaseBankParser):
             return metadata
         
         # Pattern 3: IMPS transactions
-        imps_match = re.search(
-            r'IMPS\s+([A-Z0-9]+)',
-            particulars,
-            re.IGNORECASE
-        )
+        imps_match = 'IMPS' in particulars_upper and _IMPS_RE.search(particulars)
         if imps_match:
             metadata['transferType'] = 'IMPS'
             metadata['transactionId'] = imps_match.group(1).strip()
             return metadata
         
         # Pattern 4: ATM transactions
-        atm_match = re.search(
-            r'ATM\s+(?:CASH|WITHDRAWAL|DEPOSIT)',
-            particulars,
-            re.IGNORECASE
-        )
+        atm_match = 'ATM' in particulars_upper and _ATM_RE.search(particulars)
         if atm_match:
             metadata['transferType'] = 'ATM'
             return metadata
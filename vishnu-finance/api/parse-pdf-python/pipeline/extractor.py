@@ -56,7 +56,7 @@ class ExtractorShim:
                         page_artifact.words.append(word_obj)
                     
                     ctx.pages.append(page_artifact)
-                    logger.info(f"Page {i+1} extracted: {len(page_artifact.words)} words")
+                    logger.info("Page %s extracted: %s words", i + 1, len(page_artifact.words))
                     
                     if max_pages and len(ctx.pages) >= max_pages:
                         logger.info(f"Reached max_pages limit ({max_pages}), stopping extraction.")
@@ -109,7 +109,7 @@ class ExtractorShim:
                         page_artifact.words.append(word_obj)
                 
                 ctx.pages.append(page_artifact)
-                logger.info(f"Sheet {sheet_name} extracted as Page {i+1}: {len(page_artifact.words)} words")
+                logger.info("Sheet %s extracted as Page %s: %s words", sheet_name, i + 1, len(page_artifact.words))
                 
         except Exception as e:
             logger.error(f"Excel Extraction failed: {e}")
@@ -47,7 +47,7 @@ class InferenceEngineShim:
                     # No delta. If explicit amounts exist, maybe it's a correction or non-impacting?
                     # Or it's a junk row.
                     if explicit_debit == 0 and explicit_credit == 0:
-                        logger.info(f"Skipping row with zero delta and no explicit amounts: {desc_str[:30]}...")
+                        logger.info("Skipping row with zero delta and no explicit amounts: %s...", desc_str[:30])
                         continue
             
             # Fallback/Confirmation: Logic B (Explicit Columns)
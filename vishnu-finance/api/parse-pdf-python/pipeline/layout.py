@@ -21,7 +21,7 @@ class LayoutShim:
             
             # 2. Identify header row (Candidate for Stage 7)
             # We don't finalize mapping here, but we can look for "anchor" rows
-            logger.info(f"Page {page.page_no}: Detected {len(rows)} rows")
+            logger.info("Page %s: Detected %s rows", page.page_no, len(rows))
             
         ctx.stats['layout_analysis_complete'] = True
 
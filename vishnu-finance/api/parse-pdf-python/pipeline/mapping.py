@@ -48,7 +48,7 @@ class MapperShim:
         
         for idx, row in enumerate(rows[:50]): # Check first 50 rows
             row_text = " ".join([(w.text or "").upper() for w in row])
-            logger.debug(f"Scanning row {idx}: {row_text}")
+            logger.debug("Scanning row %s: %s", idx, row_text)
             
             if self._is_header_row(row_text, matched_profile):
                 header_row = row
@@ -0,0 +1,138 @@
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add this directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import accurate_parser
+from parsers.base_parser import TransactionColumns
+from parsers.sbi_parser import SBIParser
+
+
+def test_transaction_columns_matches_list_of_dicts():
+    # Fields appear late, disappear, and change type; chunk_size=3 forces several chunks
+    rows = [
+        {'date': '01/01/2025', 'description': 'ATM', 'debit': 100.0, 'credit': 0.0},
+        {'date': '02/01/2025', 'description': 'ATM', 'debit': 0.0, 'credit': 50.5, 'store': 'Shop'},
+        {'date': '03/01/2025', 'description': 'NEFT', 'debit': 20.0},
+        {'date': '04/01/2025', 'description': 'UPI', 'debit': '7', 'credit': 1.0, 'page': 2},
+        {'date': '05/01/2025', 'credit': 3.0, 'store': None},
+        {'date': '06/01/2025', 'description': 'ATM', 'debit': 5.0, 'credit': 0.0, 'line': '12'},
+        {'date': '07/01/2025', 'description': 'IMPS', 'debit': 1.0, 'credit': 2.0},
+    ]
+    columns = TransactionColumns(chunk_size=3)
+    for row in rows:
+        columns.append(row)
+
+    assert len(columns) == len(rows)
+    pd.testing.assert_frame_equal(columns.to_dataframe(), pd.DataFrame(rows), check_dtype=False)
+
+
+def test_transaction_columns_empty():
+    assert TransactionColumns().to_dataframe().empty
+
+
+def test_normalize_transactions_df_mixed_amounts():
+    parser = SBIParser()
+    df = pd.DataFrame({
+        'debit': ['1,234.50', '', None],
+        'credit': [None, '2,000', ''],
+        'balance': ['10,000.00', '8,765.50', None],
+        'amount': [None, None, '50'],
+    })
+
+    result = parser.normalize_transactions_df(df)
+
+    assert result['debit'].tolist() == [1234.5, 0.0, 50.0]
+    assert result['credit'].tolist() == [0.0, 2000.0, 0.0]
+    assert result['balance'].tolist()[:2] == [10000.0, 8765.5]
+    assert np.isnan(result['balance'].iloc[2])
+    assert result['bankCode'].tolist() == ['SBIN'] * 3
+    # Only the row whose amount had to be inferred started out with zero debit and credit
+    assert result['hasZeroAmount'].tolist()[2] is True
+    assert result['hasZeroAmount'].iloc[:2].isna().all()
+
+
+def test_extract_store_and_commodity():
+    cases = {
+        'YESB0PTMUPI/Sangam Stationery Stores /XXXXX /pens':
+            ('Sangam Stationery Stores', 'pens', ''),
+        'UTIB0000553/RAJ KUMAR /XXXXX /paytmqr123@paytm /UPI /512345678901 /groceries':
+            ('RAJ KUMAR', 'groceries', ''),
+        'KKBK0000958/Amazon Pay /XXXXX / UPI /412345678901 /UPI':
+            ('Amazon Pay', None, ''),
+        'HDFC0000001/Swiggy/UPI/123456/food order':
+            ('Swiggy', 'Swiggy', '/food order'),
+        'NEFT transfer to landlord /rent':
+            (None, 'rent', 'NEFT transfer to landlord'),
+        'SBIN0001234/Cafe Coffee Day /XXXXX /coffee /coffee more':
+            ('Cafe Coffee Day', 'coffee more', '/coffee'),
+        'plain description':
+            (None, None, 'plain description'),
+    }
+    for description, expected in cases.items():
+        assert accurate_parser.extract_store_and_commodity(description) == expected, description
+
+
+def test_remove_commodity_matches_regex():
+    # The regex _remove_commodity replaced, built per commodity
+    cases = [
+        ('UPI /pens more /pens', 'pens'),
+        ('a /  pens', 'pens'),
+        ('a /pensx', 'pens'),
+        ('/pens', 'pens'),
+        ('/pens/pens /pens\tx', 'pens'),
+        ('x /c++ y /c++', 'c++'),
+        ('no slash pens', 'pens'),
+        ('/ /pens\n', 'pens'),
+    ]
+    for text, commodity in cases:
+        expected = re.sub(r'/\s*' + re.escape(commodity) + r'(?:\s|$)', '', text)
+        assert accurate_parser._remove_commodity(text, commodity) == expected, text
+
+
+def test_transaction_re_blocks():
+    text = (
+        'Statement header\n'
+        'Ref 12 Oct 2025 UPI/Shop One\n'
+        '/XXXXX /pens\n'
+        'INR 1,234.00 - INR 9,000.00\n'
+        '\n'
+        'Footer text\n'
+        '13 Oct 2025 NEFT\n'
+        '14 Oct 2025 IMPS\n'
+        'more detail'
+    )
+
+    blocks = [(match.group('date'), match.group(0)) for match in accurate_parser._TRANSACTION_RE.finditer(text)]
+
+    assert blocks == [
+        ('12 Oct 2025', 'Ref 12 Oct 2025 UPI/Shop One\n/XXXXX /pens\nINR 1,234.00 - INR 9,000.00'),
+        ('13 Oct 2025', '13 Oct 2025 NEFT'),
+        ('14 Oct 2025', '14 Oct 2025 IMPS\nmore detail'),
+    ]
+
+
+def test_fingerprint_dedup_keeps_first_row():
+    parser = SBIParser()
+    first = {'date_iso': '2025-10-12', 'description': 'ATM', 'debit': 100.0, 'credit': 0.0, 'page': 1}
+    duplicate = dict(first, page=2)
+    other = dict(first, debit=200.0, page=2)
+    parser.iter_parsed_pdf_pages = lambda pdf_path: iter([first, duplicate, other])
+
+    df = parser.parse_pdf('statement.pdf')
+
+    assert parser.transaction_fingerprint(first) == parser.transaction_fingerprint(duplicate)
+    assert df['debit'].tolist() == [100.0, 200.0]
+    assert df['page'].tolist() == [1, 2]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: OK")